@@ -1,143 +1,388 @@
 #!/usr/bin/env python3
-"""Extract frames from person-detected clips with both bird and person confidence.
+"""Extract frames from bird-detected clips with both bird and person confidence.
 
-Usage: python review_person_detections.py /path/to/batch/has_birds/
+filter records bird detections only, so every clip in detections.json is
+reviewed at its first_bird timestamp. The person confidence in each saved
+filename flags frames where a person was detected as well.
+
+Usage: python review_person_detections.py /path/to/batch/ [--batch-size N] [--workers N] [--tensorrt]
+       [--reader {cv2,pyav}]
 """
 
+import argparse
 import json
+import os
+import sqlite3
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 import cv2
 from tqdm import tqdm
+from ultralytics import YOLO
 
-# Import from birdbird package
-from src.birdbird.detector import BirdDetector
+from birdbird.detector import BirdDetector, resize_for_model
+from birdbird.paths import BirdbirdPaths
 
+try:
+    from turbojpeg import TJSAMP_420, TurboJPEG
 
-def get_detection_confidences(detector: BirdDetector, frame):
-    """Run YOLO and return both bird and person confidences (max of each class).
+    _turbojpeg = TurboJPEG()
+except Exception:  # PyTurboJPEG or libturbojpeg not installed - fall back to cv2
+    _turbojpeg = None
 
-    Returns: (bird_conf, person_conf) tuple, where None means no detection
+PERSON_CLASS_ID = 0  # COCO class ID for 'person'
+
+
+def use_tensorrt_engine(detector: BirdDetector, batch_size: int) -> Path | None:
+    """Swap detector.model for an FP16 TensorRT engine, exporting it on first use.
+
+    The engine is cached next to the .pt weights and reused on later runs.
+    Falls back to the original PyTorch model when CUDA or TensorRT is unavailable.
+
+    Returns: Path of the TensorRT engine in use, or None for the PyTorch model
     """
-    # Run with very low confidence threshold to capture ALL detections
-    results = detector.model(frame, verbose=False, conf=0.01)
+    try:
+        import torch
+
+        if not torch.cuda.is_available():
+            print("CUDA not available - using PyTorch model")
+            return None
+
+        pt_path = Path(getattr(detector.model, "ckpt_path", None) or "yolov8n.pt")
+        engine_path = pt_path.with_suffix(".engine")
+        if not engine_path.exists():
+            print(f"Exporting TensorRT engine to {engine_path} (one-time)...")
+            engine_path = Path(
+                detector.model.export(format="engine", half=True, batch=batch_size, dynamic=True, imgsz=640)
+            )
+        detector.model = YOLO(str(engine_path), task="detect")
+        print(f"Using TensorRT engine: {engine_path}")
+        return engine_path
+    except Exception as e:
+        print(f"TensorRT unavailable ({e}) - using PyTorch model")
+        return None
+
+
+def confidences_from_result(detector: BirdDetector, result):
+    """Return both bird and person confidences (max of each class) for one image.
 
+    Returns: (bird_conf, person_conf) tuple, where None means no detection
+    """
     bird_conf = None
     person_conf = None
 
-    if results and len(results) > 0:
-        for result in results:
-            boxes = result.boxes
-            if boxes is None or len(boxes) == 0:
-                continue
+    boxes = result.boxes
+    if boxes is None or len(boxes) == 0:
+        return bird_conf, person_conf
 
-            for box in boxes:
-                class_id = int(box.cls[0])
-                conf = float(box.conf[0])
+    for box in boxes:
+        class_id = int(box.cls[0])
+        conf = float(box.conf[0])
 
-                if class_id == detector.BIRD_CLASS_ID:
-                    bird_conf = max(bird_conf or 0, conf)
-                elif class_id == detector.PERSON_CLASS_ID:
-                    person_conf = max(person_conf or 0, conf)
+        if class_id == detector.BIRD_CLASS_ID:
+            bird_conf = max(bird_conf or 0, conf)
+        elif class_id == PERSON_CLASS_ID:
+            person_conf = max(person_conf or 0, conf)
 
     return bird_conf, person_conf
 
 
-def main():
-    if len(sys.argv) != 2:
-        print("Usage: python review_person_detections.py /path/to/batch/has_birds/")
-        sys.exit(1)
+def get_detection_confidences(detector: BirdDetector, frames: list):
+    """Run YOLO on a batch of frames and return bird/person confidences per frame.
 
-    input_dir = Path(sys.argv[1])
-    if not input_dir.is_dir():
-        print(f"Error: {input_dir} is not a directory")
-        sys.exit(1)
+    Returns: list of (bird_conf, person_conf) tuples, in the same order as frames
+    """
+    # Run with very low confidence threshold to capture ALL detections. Only the
+    # bird and person maxima are used, so restrict NMS to those two classes -
+    # boxes of the other 78 classes are dropped before NMS rather than sorted through it.
+    results = detector.model(
+        [resize_for_model(frame) for frame in frames],
+        verbose=False,
+        conf=0.01,
+        classes=[detector.BIRD_CLASS_ID, PERSON_CLASS_ID],
+    )
+    return [confidences_from_result(detector, result) for result in results]
+
+
+def save_review_frame(output_dir: Path, clip_name: str, frame, bird_conf, person_conf) -> None:
+    """Save frame with its bird/person confidences encoded in the filename."""
+    # Format confidences for filename (3 digits, or 'none')
+    bird_str = f"{int(bird_conf * 1000):03d}" if bird_conf else "none"
+    person_str = f"{int(person_conf * 1000):03d}" if person_conf else "none"
+
+    # Generate filename: clipname_bird050_person367.jpg
+    clip_base = clip_name.replace(".avi", "")
+    filename = f"{clip_base}_bird{bird_str}_person{person_str}.jpg"
+    output_path = output_dir / filename
+
+    # Save frame with high quality
+    output_path.write_bytes(encode_jpeg(frame))
+
+
+def encode_jpeg(frame, quality: int = 95) -> bytes:
+    """Encode a BGR frame as JPEG, using libjpeg-turbo directly when available."""
+    if _turbojpeg is not None:
+        # 4:2:0 subsampling matches cv2.imwrite's default output
+        return _turbojpeg.encode(frame, quality=quality, jpeg_subsample=TJSAMP_420)
+    ok, data = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    if not ok:
+        raise RuntimeError("JPEG encoding failed")
+    return data.tobytes()
+
+
+def open_cache(output_dir: Path) -> sqlite3.Connection:
+    """Open (creating if needed) the confidence cache in the review output directory."""
+    cache = sqlite3.connect(output_dir / "cache.db")
+    cache.execute("CREATE TABLE IF NOT EXISTS detections (key TEXT PRIMARY KEY, bird REAL, person REAL)")
+    return cache
+
+
+def flush_batch(
+    detector: BirdDetector, batch: list, output_dir: Path, cache: sqlite3.Connection, writer: ThreadPoolExecutor
+) -> list[Future]:
+    """Run detection on buffered (clip_name, cache_key, frame) entries and save the frames.
+
+    Confidences already in the cache are reused; YOLO only runs on cache misses.
+    Frames are encoded and written on the writer pool so disk I/O overlaps the
+    next batch.
+
+    Returns: futures for the pending frame writes
+    """
+    if not batch:
+        return []
+
+    keys = [cache_key for _, cache_key, _ in batch]
+    placeholders = ",".join("?" * len(keys))
+    cached = {
+        key: (bird, person)
+        for key, bird, person in cache.execute(
+            f"SELECT key, bird, person FROM detections WHERE key IN ({placeholders})",
+            keys,  # nosec B608
+        )
+    }
 
-    # Load detections
-    detections_file = input_dir / "detections.json"
-    if not detections_file.exists():
-        print(f"Error: {detections_file} not found")
-        sys.exit(1)
+    misses = [(cache_key, frame) for _, cache_key, frame in batch if cache_key not in cached]
+    if misses:
+        confidences = get_detection_confidences(detector, [frame for _, frame in misses])
+        computed = {cache_key: conf for (cache_key, _), conf in zip(misses, confidences)}
+        cache.executemany(
+            "INSERT OR REPLACE INTO detections (key, bird, person) VALUES (?, ?, ?)",
+            [(key, bird, person) for key, (bird, person) in computed.items()],
+        )
+        cache.commit()
+        cached.update(computed)
 
-    with open(detections_file) as f:
-        detections = json.load(f)
+    writes = []
+    for clip_name, cache_key, frame in batch:
+        bird_conf, person_conf = cached[cache_key]
+        writes.append(writer.submit(save_review_frame, output_dir, clip_name, frame, bird_conf, person_conf))
+    batch.clear()
+    return writes
 
-    # Filter for person detections
-    person_clips = {
-        clip: info for clip, info in detections.items()
-        if info.get('detection_type') == 'person'
-    }
 
-    print(f"Found {len(person_clips)} clips with person detection")
+def read_frame_at(cap: cv2.VideoCapture, frame_num: int):
+    """Read the frame at frame_num by stepping through the stream sequentially.
 
-    if not person_clips:
-        print("No person-detected clips to review")
-        return
+    Skipped frames are only grabbed (not decoded), matching the sequential
+    read the detector used without paying for full BGR conversion of each.
 
-    # Create output directory
-    output_dir = input_dir.parent / "person_detection_review"
-    output_dir.mkdir(exist_ok=True)
-    print(f"Saving frames to: {output_dir}")
+    Returns: BGR frame, or None if the stream ends before frame_num
+    """
+    # Grab frames 0..frame_num inclusive; only the last one is decoded
+    for _ in range(frame_num + 1):
+        if not cap.grab():
+            return None
+    ret, frame = cap.retrieve()
+    return frame if ret else None
 
-    # Initialize detector with same thresholds used during filtering
-    detector = BirdDetector(bird_confidence=0.2, person_confidence=0.3)
 
-    # Process each clip
-    print("\nExtracting frames and detecting confidences...")
-    for clip_name, detection_info in tqdm(list(person_clips.items())):
-        clip_path = input_dir / clip_name
-        if not clip_path.exists():
-            continue
-
-        # Open video and read sequentially to detection frame (same as original detector)
-        cap = cv2.VideoCapture(str(clip_path))
-        if not cap.isOpened():
-            continue
-
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        timestamp = detection_info['first_bird']  # Actually first_detection
+def read_frame_pyav(clip_path: Path, timestamp: float):
+    """Read the frame at timestamp with PyAV using a keyframe seek.
+
+    The camera writes MJPEG, where every frame is a keyframe, so the seek lands
+    on (or just before) the target and only a frame or two is decoded.
+
+    Returns: (target_frame_num, frame) tuple; frame is None if not found
+    """
+    import av
+
+    with av.open(str(clip_path)) as container:
+        stream = container.streams.video[0]
+        fps = float(stream.average_rate or 0)
         target_frame_num = int(timestamp * fps)
+        if fps <= 0 or stream.time_base is None:
+            return target_frame_num, None
+
+        target_pts = (stream.start_time or 0) + round(target_frame_num / fps / stream.time_base)
+        container.seek(target_pts, stream=stream)
+        for frame in container.decode(stream):
+            if frame.pts is not None and frame.pts >= target_pts:
+                return target_frame_num, frame.to_ndarray(format="bgr24")
+
+    return target_frame_num, None
+
+
+def read_frame_cv2(clip_path: Path, timestamp: float):
+    """Read the frame at timestamp with cv2, stepping sequentially (same as detector).
+
+    Returns: (target_frame_num, frame) tuple; frame is None if not found
+    """
+    cap = cv2.VideoCapture(str(clip_path))
+    if not cap.isOpened():
+        return 0, None
 
-        # Read sequentially to exact frame (same as detector does)
-        frame = None
-        frame_count = 0
-        while True:
-            ret, current_frame = cap.read()
-            if not ret:
-                break
-            if frame_count == target_frame_num:
-                frame = current_frame
-                break
-            frame_count += 1
+    fps = cap.get(cv2.CAP_PROP_FPS)
+    target_frame_num = int(timestamp * fps)
 
-        cap.release()
+    # Step sequentially to exact frame (same as detector does)
+    frame = read_frame_at(cap, target_frame_num)
+    cap.release()
+    return target_frame_num, frame
 
-        if frame is None:
-            continue
 
-        # Get both bird and person confidences
-        bird_conf, person_conf = get_detection_confidences(detector, frame)
+def load_review_frame(clip_path: Path, timestamp: float, reader: str = "cv2"):
+    """Open a clip and read the frame at timestamp (first_detection).
 
-        # Format confidences for filename (3 digits, or 'none')
-        bird_str = f"{int(bird_conf * 1000):03d}" if bird_conf else "none"
-        person_str = f"{int(person_conf * 1000):03d}" if person_conf else "none"
+    Args:
+        clip_path: Path to clip
+        timestamp: Detection timestamp in seconds
+        reader: "cv2" (sequential read) or "pyav" (keyframe seek)
 
-        # Generate filename: clipname_bird050_person367.jpg
-        clip_base = clip_name.replace('.avi', '')
-        filename = f"{clip_base}_bird{bird_str}_person{person_str}.jpg"
-        output_path = output_dir / filename
+    Returns: (cache_key, frame) tuple, where cache_key identifies the clip
+    version and frame index; (None, None) if the clip is missing or unreadable
+    """
+    try:
+        mtime_ns = clip_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None, None
+
+    if reader == "pyav":
+        target_frame_num, frame = read_frame_pyav(clip_path, timestamp)
+    else:
+        target_frame_num, frame = read_frame_cv2(clip_path, timestamp)
 
-        # Save frame with high quality
-        cv2.imwrite(str(output_path), frame, [cv2.IMWRITE_JPEG_QUALITY, 95])
+    if frame is None:
+        return None, None
+    return f"{clip_path.name}:{mtime_ns}:{target_frame_num}", frame
 
-    print(f"\nComplete! Saved {len(person_clips)} frames to {output_dir}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract frames from bird-detected clips for person review")
+    parser.add_argument("input_dir", type=Path, help="Batch directory of original .avi clips (already filtered)")
+    parser.add_argument("--batch-size", type=int, default=16, help="Frames per YOLO inference call (default: 16)")
+    parser.add_argument("--workers", type=int, default=None, help="Frame decode threads (default: half the CPU cores)")
+    parser.add_argument(
+        "--tensorrt", action="store_true", help="Run YOLO as an FP16 TensorRT engine (exported on first use)"
+    )
+    parser.add_argument(
+        "--reader",
+        choices=["cv2", "pyav"],
+        default="cv2",
+        help="Frame reader: cv2 sequential read (default) or PyAV keyframe seek (requires 'av')",
+    )
+    args = parser.parse_args()
+
+    input_dir = args.input_dir
+    if not input_dir.is_dir():
+        print(f"Error: {input_dir} is not a directory")
+        sys.exit(1)
+
+    # Load detections written by `birdbird filter`
+    paths = BirdbirdPaths.from_input_dir(input_dir)
+    if not paths.detections_json.exists():
+        print(f"Error: {paths.detections_json} not found (run 'birdbird filter' first)")
+        sys.exit(1)
+
+    with open(paths.detections_json) as f:
+        detections = json.load(f)
+
+    print(f"Found {len(detections)} clips with bird detections")
+
+    if not detections:
+        print("No detected clips to review")
+        return
+
+    # Create output directory
+    output_dir = paths.working_dir / "person_review"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    print(f"Saving frames to: {output_dir}")
+
+    # Initialize detector with the threshold used during filtering
+    detector = BirdDetector(bird_confidence=0.2)
+    engine_path = use_tensorrt_engine(detector, args.batch_size) if args.tensorrt else None
+
+    # Cache confidences per (clip, mtime, frame, model) so re-runs skip YOLO.
+    # The tag names the weights actually loaded and their precision, so FP16
+    # engine results never answer for FP32 PyTorch lookups (or vice versa).
+    cache = open_cache(output_dir)
+    if engine_path is not None:
+        model_tag = f"{engine_path.name}:fp16"
+    else:
+        model_tag = f"{Path(getattr(detector.model, 'ckpt_path', None) or 'yolov8n.pt').name}:fp32"
+
+    reader = args.reader
+    if reader == "pyav":
+        try:
+            import av  # noqa: F401
+        except ImportError:
+            print("PyAV not installed (pip install av) - using cv2 reader")
+            reader = "cv2"
+
+    # Decode frames on a thread pool (cv2 releases the GIL) while YOLO runs on
+    # the previous batch; at most two batches of decoded frames are in flight
+    print("\nExtracting frames and detecting confidences...")
+    cv2.setNumThreads(1)  # avoid oversubscribing cores across decode workers
+    # One directory read instead of a stat per clip to drop clips that are gone
+    existing = {entry.name for entry in os.scandir(input_dir) if entry.is_file()}
+    items = [(clip_name, info) for clip_name, info in detections.items() if clip_name in existing]
+    if len(items) < len(detections):
+        print(f"Skipping {len(detections) - len(items)} clips missing from {input_dir}")
+    if not items:
+        cache.close()
+        return
+    chunks = [items[i : i + args.batch_size] for i in range(0, len(items), args.batch_size)]
+    workers = args.workers or max(1, (os.cpu_count() or 2) // 2)
+
+    with (
+        ThreadPoolExecutor(max_workers=workers) as executor,
+        ThreadPoolExecutor(max_workers=2) as writer,
+        tqdm(total=len(items)) as pbar,
+    ):
+
+        def submit_chunk(chunk):
+            return [
+                (clip_name, executor.submit(load_review_frame, input_dir / clip_name, info["first_bird"], reader))
+                for clip_name, info in chunk
+            ]
+
+        pending = submit_chunk(chunks[0])
+        writes: list[Future] = []
+        for next_chunk in chunks[1:] + [None]:
+            batch = [(clip_name, *future.result()) for clip_name, future in pending]
+            pending = submit_chunk(next_chunk) if next_chunk else []
+
+            loaded = [
+                (clip_name, f"{cache_key}:{model_tag}", frame)
+                for clip_name, cache_key, frame in batch
+                if frame is not None
+            ]
+            writes.extend(flush_batch(detector, loaded, output_dir, cache, writer))
+            pbar.update(len(batch))
+
+        # Surface any write errors
+        for write in writes:
+            write.result()
+
+    cache.close()
+
+    print(f"\nComplete! Saved {len(writes)} frames to {output_dir}")
     print("\nFilename format: clipname_birdXXX_personYYY.jpg")
     print("  - XXX/YYY are confidence values (0-999, e.g., 367 = 0.367)")
     print("  - 'none' means no detection of that class")
     print("\nReview the images to count:")
     print("  - Actual birds (true positives)")
-    print("  - False positives (decorations, etc.)")
+    print("  - False positives (decorations, people, etc.)")
 
 
 if __name__ == "__main__":
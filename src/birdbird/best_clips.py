@@ -6,10 +6,13 @@ time windows for each detected species, supporting seek functionality in the vie
 @author Claude Sonnet 4.5 Anthropic
 """
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
+
+from .paths import read_json, write_json
+
 
 @dataclass
 class BestClip:
@@ -31,7 +34,8 @@ def find_best_clip_for_species(
 ) -> BestClip | None:
     """Find best time window for a species using sliding window scoring.
 
-    Uses a two-pointer sliding window approach for O(n) time complexity.
+    Uses prefix sums over sorted timestamps, with searchsorted locating the
+    start of each window, so the whole scan runs vectorized in NumPy.
 
     Args:
         detections: List of detection dicts with timestamp_s, species, confidence
@@ -49,49 +53,78 @@ def find_best_clip_for_species(
         if d["species"] == species
     ]
 
-    if not species_detections:
-        return None
-
-    # Sort by timestamp
-    species_detections.sort(key=lambda d: d["timestamp_s"])
-
-    # Sliding window with two pointers - O(n) algorithm
-    best_score = 0.0
-    best_start_idx = 0
-    best_count = 0
+    return _best_clip_from_bucket(species_detections, species, window_duration_s)
 
-    current_score = 0.0
-    window_start = 0
 
-    # Expand window by moving end pointer
-    for window_end in range(len(species_detections)):
-        # Add current detection to window
-        current_score += species_detections[window_end]["confidence"]
+def _window_scores(
+    species_detections: list[dict],
+    window_duration_s: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Score the window ending at each detection, in timestamp order.
 
-        # Shrink window from left while detections fall outside window duration
-        window_start_time = species_detections[window_start]["timestamp_s"]
-        window_end_time = species_detections[window_end]["timestamp_s"]
+    Returns:
+        (timestamps, starts, ends, scores) where window i covers sorted
+        detections starts[i]..ends[i]-1 and scores[i] is their confidence sum
+    """
+    timestamps = np.fromiter((d["timestamp_s"] for d in species_detections), dtype=np.float64)
+    confidences = np.fromiter((d["confidence"] for d in species_detections), dtype=np.float64)
+
+    # Sort by timestamp (stable, so ties keep input order)
+    order = np.argsort(timestamps, kind="stable")
+    timestamps = timestamps[order]
+    confidences = confidences[order]
+
+    starts, ends, scores = _score_sorted(timestamps, confidences, window_duration_s)
+    return timestamps, starts, ends, scores
+
+
+def _score_sorted(
+    timestamps: np.ndarray,
+    confidences: np.ndarray,
+    window_duration_s: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Score windows over timestamps that are already sorted ascending."""
+    # Window ending at detection i starts at the first detection within window_duration_s of it
+    cumulative = np.concatenate(([0.0], np.cumsum(confidences)))
+    starts = np.searchsorted(timestamps, timestamps - window_duration_s, side="left")
+    ends = np.arange(1, len(timestamps) + 1)
+    scores = cumulative[ends] - cumulative[starts]
+    return starts, ends, scores
+
+
+def _best_clip_from_bucket(
+    species_detections: list[dict],
+    species: str,
+    window_duration_s: float,
+) -> BestClip | None:
+    """Run the sliding window over detections already filtered to one species."""
+    if not species_detections:
+        return None
 
-        while (window_end_time - window_start_time) > window_duration_s:
-            current_score -= species_detections[window_start]["confidence"]
-            window_start += 1
-            window_start_time = species_detections[window_start]["timestamp_s"]
+    timestamps, starts, ends, scores = _window_scores(species_detections, window_duration_s)
+    return _best_clip_from_scores(species, timestamps, starts, ends, scores, window_duration_s)
 
-        # Check if this is the best window so far
-        if current_score > best_score:
-            best_score = current_score
-            best_start_idx = window_start
-            best_count = window_end - window_start + 1
 
-    best_start = species_detections[best_start_idx]["timestamp_s"]
+def _best_clip_from_scores(
+    species: str,
+    timestamps: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    scores: np.ndarray,
+    window_duration_s: float,
+) -> BestClip:
+    """Build the BestClip for the highest-scoring window."""
+    # argmax returns the earliest best window, matching a strict > scan
+    best = int(np.argmax(scores))
+    best_start = float(timestamps[starts[best]])
     best_end = best_start + window_duration_s
 
     return BestClip(
         species=species,
         start_s=best_start,
         end_s=best_end,
-        score=round(best_score, 3),
-        detection_count=best_count,
+        score=round(float(scores[best]), 3),
+        detection_count=int(ends[best] - starts[best]),
     )
 
 
@@ -113,17 +146,33 @@ def find_all_best_clips(
     if not species_json_path.exists():
         raise FileNotFoundError(f"Species data not found: {species_json_path}")
 
-    with open(species_json_path) as f:
-        data = json.load(f)
+    data = read_json(species_json_path)
 
     detections = data.get("detections", [])
     species_list = list(data.get("species_summary", {}).keys())
 
+    if not detections:
+        return {}
+
+    # Load columns once, then sort by (species, timestamp) so each species is
+    # a contiguous, time-ordered slice. lexsort is stable, so ties keep input order.
+    timestamps = np.fromiter((d["timestamp_s"] for d in detections), dtype=np.float64)
+    confidences = np.fromiter((d["confidence"] for d in detections), dtype=np.float64)
+    names, species_idx = np.unique([d["species"] for d in detections], return_inverse=True)
+    order = np.lexsort((timestamps, species_idx))
+    timestamps = timestamps[order]
+    confidences = confidences[order]
+    bounds = np.searchsorted(species_idx[order], np.arange(len(names) + 1))
+    slices = {str(name): (bounds[i], bounds[i + 1]) for i, name in enumerate(names)}
+
     best_clips = {}
     for species in species_list:
-        clip = find_best_clip_for_species(detections, species, window_duration_s)
-        if clip:
-            best_clips[species] = clip
+        if species not in slices:
+            continue
+        lo, hi = slices[species]
+        ts = timestamps[lo:hi]
+        starts, ends, scores = _score_sorted(ts, confidences[lo:hi], window_duration_s)
+        best_clips[species] = _best_clip_from_scores(species, ts, starts, ends, scores, window_duration_s)
 
     return best_clips
 
@@ -156,5 +205,4 @@ def save_best_clips(
         }
     }
 
-    with open(output_path, "w") as f:
-        json.dump(data, f, indent=2)
+    write_json(output_path, data)
@@ -3,22 +3,22 @@
 @author Claude Opus 4.5 Anthropic
 """
 
-import json
+import os
 import shutil
+import sys
+import threading
+import time
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 
 import typer
 
-from .best_clips import find_all_best_clips, save_best_clips
-from .config import get_location, get_species_config
-from .filter import filter_clips
-from .frames import extract_and_score_frames, save_frame_metadata, save_top_frames
-from .highlights import generate_highlights, get_video_duration
-from .paths import BirdbirdPaths
-from .publish import extract_date_range, publish_to_r2
-from .songs import analyze_songs, save_song_detections
-from .species import identify_species, save_species_results
+from .config import get_location, get_species_config, load_calibration, save_calibration
+from .paths import BirdbirdPaths, list_clips, read_json, write_json
+
+# Pipeline modules pull in cv2, ultralytics, boto3 etc., so commands import
+# them on use to keep --help and shell completion fast.
 
 app = typer.Typer(help="Bird feeder video analysis pipeline")
 
@@ -28,11 +28,145 @@ def format_duration(seconds: float) -> str:
 
     @author Claude Sonnet 4.5 Anthropic
     """
-    minutes = int(seconds // 60)
-    secs = int(seconds % 60)
+    minutes, secs = divmod(int(seconds), 60)
     return f"{minutes}m:{secs:02d}s"
 
 
+def _count_files(directory: Path, suffix: str, prefix: str = "") -> int:
+    """Count files named prefix*suffix in directory (0 if it doesn't exist)."""
+    try:
+        with os.scandir(directory) as entries:
+            return sum(1 for entry in entries if entry.name.startswith(prefix) and entry.name.endswith(suffix))
+    except FileNotFoundError:
+        return 0
+
+
+def _remove_tree_in_background(directory: Path) -> None:
+    """Move a directory out of the way and delete it on a background thread.
+
+    The rename is a single syscall on the same filesystem, so the caller can
+    recreate the directory immediately. The deleting thread is not a daemon,
+    so the interpreter waits for it at exit rather than leaving trash behind.
+    Falls back to a synchronous delete if the rename fails.
+
+    Args:
+        directory: Directory to remove
+    """
+    trash = directory.with_name(f".{directory.name}.trash-{os.getpid()}")
+    try:
+        directory.rename(trash)
+    except OSError:
+        shutil.rmtree(directory)
+        return
+    threading.Thread(target=shutil.rmtree, args=(trash,), kwargs={"ignore_errors": True}).start()
+
+
+def _clear_birdbird_dir(paths: BirdbirdPaths) -> None:
+    """Remove previous results from birdbird/, keeping the cache directory.
+
+    The detection and duration caches are keyed by clip content, so they stay
+    valid across a fresh run and let process --force skip YOLO and duration
+    probes for unchanged clips.
+
+    Args:
+        paths: Paths for the input directory being reprocessed
+    """
+    for child in paths.birdbird_dir.iterdir():
+        if child == paths.cache_dir:
+            continue
+        if child.is_dir() and not child.is_symlink():
+            _remove_tree_in_background(child)
+        else:
+            child.unlink()
+
+
+def _check_confidence(value: float, option: str) -> None:
+    """Exit with an error unless a confidence threshold is within 0.0-1.0.
+
+    Args:
+        value: Threshold given on the command line
+        option: Option name for the error message (e.g. "--bird-conf")
+    """
+    if not 0.0 <= value <= 1.0:
+        typer.echo(f"Error: {option} must be between 0.0 and 1.0", err=True)
+        raise typer.Exit(1)
+
+
+def _resolve_location(lat: float | None, lon: float | None) -> tuple[float | None, float | None, bool]:
+    """Apply the config location if neither --lat nor --lon is given, then validate.
+
+    Args:
+        lat: --lat value, if any
+        lon: --lon value, if any
+
+    Returns:
+        (lat, lon, from_config) tuple
+
+    Raises:
+        typer.Exit: If only one of lat/lon is set after applying config
+    """
+    from_config = False
+    if lat is None and lon is None:
+        config_lat, config_lon = get_location()
+        if config_lat is not None and config_lon is not None:
+            lat, lon = config_lat, config_lon
+            from_config = True
+
+    # Both or neither after config applied
+    if (lat is None) != (lon is None):
+        typer.echo("Error: --lat and --lon must both be provided for location filtering", err=True)
+        raise typer.Exit(1)
+    return lat, lon, from_config
+
+
+def _confirm_overwrite(output: Path, force: bool, action: str) -> None:
+    """Remove an existing output file, prompting first unless force is set.
+
+    Args:
+        output: Output file the command is about to write
+        force: Remove without prompting
+        action: Verb for the recommended option (e.g. "re-analyze")
+
+    Raises:
+        typer.Exit: If the user cancels, or stdin is not a terminal and force is not set
+    """
+    if force:
+        # Unlink directly: one syscall, no exists() check beforehand
+        try:
+            output.unlink()
+        except FileNotFoundError:
+            return
+        typer.echo(f"Removed existing {output}")
+        typer.echo("")
+        return
+
+    if not output.exists():
+        return
+
+    if not sys.stdin.isatty():
+        typer.echo(
+            f"Error: {output} already exists (use --force to overwrite when running non-interactively)", err=True
+        )
+        raise typer.Exit(1)
+
+    typer.echo(f"Warning: {output} already exists")
+    typer.echo("")
+    typer.echo("Options:")
+    typer.echo(f"  1. Remove and {action} (recommended)")
+    typer.echo("  2. Cancel")
+    typer.echo("")
+
+    choice = typer.prompt("Choose option", type=int, default=1)
+
+    if choice == 1:
+        typer.echo(f"Removing {output}...")
+        output.unlink()
+        typer.echo("")
+    else:
+        typer.echo("Cancelled")
+        raise typer.Exit(0)
+
+
 def write_local_metadata(paths: BirdbirdPaths, input_dir: Path) -> None:
     """Write metadata.json to assets directory after processing.
 
@@ -42,7 +176,7 @@ def write_local_metadata(paths: BirdbirdPaths, input_dir: Path) -> None:
     @author Claude Sonnet 4.5 Anthropic
     """
     # Extract date range (use same logic as publish)
-    from .publish import extract_original_date
+    from .publish import extract_date_range, extract_original_date
 
     original_date = extract_original_date(input_dir)
     start_date, end_date = extract_date_range(input_dir, original_date)
@@ -50,9 +184,8 @@ def write_local_metadata(paths: BirdbirdPaths, input_dir: Path) -> None:
     # Read songs if available
     song_species = []
     if paths.songs_json.exists():
-        with open(paths.songs_json) as f:
-            songs_data = json.load(f)
-            song_species = songs_data.get("summary", {}).get("species_list", [])
+        songs_data = read_json(paths.songs_json)
+        song_species = songs_data.get("summary", {}).get("species_list", [])
 
     # Count clips from detections
     clip_count = 0
@@ -78,8 +211,7 @@ def write_local_metadata(paths: BirdbirdPaths, input_dir: Path) -> None:
 
     # Write to assets
     paths.ensure_assets_dirs()
-    with open(paths.metadata_json, "w") as f:
-        json.dump(metadata, f, indent=2)
+    write_json(paths.metadata_json, metadata)
 
 
 @app.command()
@@ -87,26 +219,41 @@ def filter(
     input_dir: Path = typer.Argument(..., help="Directory containing .avi clips"),
     bird_confidence: float = typer.Option(0.2, "--bird-conf", "-b", help="Min confidence for bird detection"),
     limit: int | None = typer.Option(None, "--limit", "-l", help="Max clips to process (for testing)"),
+    workers: int = typer.Option(
+        1, "--workers", "-w", min=1, help="Parallel detection processes (each loads its own model)"
+    ),
 ) -> None:
     """Filter clips to keep only those containing birds."""
     if not input_dir.is_dir():
         typer.echo(f"Error: {input_dir} is not a directory", err=True)
         raise typer.Exit(1)
+    _check_confidence(bird_confidence, "--bird-conf")
 
-    # Count clips and estimate duration (~2.3s per clip based on benchmarks)
-    clips = sorted(input_dir.glob("*.avi"))
-    clip_count = min(len(clips), limit) if limit else len(clips)
-    est_seconds = clip_count * 2.3
+    # Count clips and estimate duration from this host's last measured rate
+    clips = list_clips(input_dir, limit)
+    clip_count = len(clips)
+    calibration = load_calibration()
+    est_seconds = clip_count * calibration["filter_s_per_clip"] / workers
     est_minutes = est_seconds / 60
 
     typer.echo(f"Processing {clip_count} clips in {input_dir} (estimated {est_minutes:.1f} minutes)")
-    typer.echo(f"Settings: bird_conf={bird_confidence}")
+    typer.echo(f"Settings: bird_conf={bird_confidence}, workers={workers}")
+
+    from .filter import filter_clips
 
+    filter_start = time.perf_counter()
     stats = filter_clips(
         input_dir,
         bird_confidence=bird_confidence,
-        limit=limit,
+        clips=clips,
+        workers=workers,
     )
+    # Only clips actually run through YOLO say anything about this host's speed
+    if stats["scanned"]:
+        save_calibration(
+            filter_s_per_clip=(time.perf_counter() - filter_start) * workers / stats["scanned"],
+            bird_clip_ratio=stats["with_birds"] / stats["total"],
+        )
 
     typer.echo("")
     typer.echo("Results:")
@@ -146,7 +293,9 @@ def highlights(
     if not input_dir.is_dir():
         typer.echo(f"Error: {input_dir} is not a directory", err=True)
         raise typer.Exit(1)
+    _check_confidence(bird_confidence, "--bird-conf")
 
+    from .highlights import generate_highlights
     from .paths import BirdbirdPaths
 
     paths = BirdbirdPaths.from_input_dir(input_dir)
@@ -161,7 +310,7 @@ def highlights(
         output = paths.highlights_mp4
 
     # Count clips and estimate duration (~7s per clip with binary search + extraction)
-    clips = list(paths.clips_dir.glob("*.avi"))
+    clips = list_clips(paths.clips_dir)
     clip_count = len(clips)
     est_seconds = clip_count * 7
     est_minutes = est_seconds / 60
@@ -182,6 +331,7 @@ def highlights(
             threads=threads,
             optimize_web=not highest_quality,
             paths=paths,
+            clips=clips,
         )
 
         typer.echo("")
@@ -209,14 +359,21 @@ def process(
     buffer_after: float = typer.Option(1.0, "--buffer-after", help="Seconds after last bird detection"),
     threads: int = typer.Option(2, "--threads", "-t", help="Max ffmpeg threads (default 2 for low-power systems)"),
     song_threads: int = typer.Option(2, "--song-threads", help="CPU threads for BirdNET"),
-    lat: float = typer.Option(None, "--lat", help="Latitude for species filtering (default: from config)"),
-    lon: float = typer.Option(None, "--lon", help="Longitude for species filtering (default: from config)"),
+    song_batch_size: int = typer.Option(8, "--song-batch-size", min=1, help="Audio chunks per BirdNET inference call"),
+    workers: int = typer.Option(
+        1, "--workers", "-w", min=1, help="Parallel detection processes (each loads its own model)"
+    ),
+    lat: float | None = typer.Option(None, "--lat", help="Latitude for species filtering (default: from config)"),
+    lon: float | None = typer.Option(None, "--lon", help="Longitude for species filtering (default: from config)"),
     limit: int | None = typer.Option(None, "--limit", "-l", help="Max clips to process (for testing)"),
     force: bool = typer.Option(False, "--force", "-f", help="Clear existing birdbird/ directory without prompting"),
     highest_quality: bool = typer.Option(
         False, "--highest-quality", help="Use highest quality (1440x1080 @ 30fps, larger file)"
     ),
     no_song_clips: bool = typer.Option(False, "--no-song-clips", help="Skip extracting audio clips for each species"),
+    skip_original_duration: bool = typer.Option(
+        False, "--skip-original-duration", help="Don't measure total input footage (omitted from the summary)"
+    ),
     run_species: bool = typer.Option(
         None, "--species/--no-species", help="Run visual species identification (default: from config)"
     ),
@@ -230,7 +387,17 @@ def process(
         typer.echo(f"Error: {input_dir} is not a directory", err=True)
         raise typer.Exit(1)
 
+    # Validate options before clearing previous results or loading any pipeline code
+    _check_confidence(bird_confidence, "--bird-conf")
+    _check_confidence(song_confidence, "--song-conf")
+    lat, lon, _ = _resolve_location(lat, lon)
+
+    from .best_clips import find_all_best_clips, save_best_clips
+    from .filter import filter_clips
+    from .highlights import generate_highlights, total_video_duration
     from .paths import BirdbirdPaths
+    from .songs import analyze_songs, save_song_detections
+    from .species import identify_species, save_species_results
 
     paths = BirdbirdPaths.from_input_dir(input_dir)
 
@@ -239,28 +406,24 @@ def process(
         species_config = get_species_config()
         run_species = species_config.enabled
 
-    # Estimate total time: ~2.3s filter + ~5s highlights per clip with birds (~30% detection rate)
-    clips = sorted(input_dir.glob("*.avi"))
-    clip_count = min(len(clips), limit) if limit else len(clips)
-    est_bird_clips = int(clip_count * 0.3)  # Assume ~30% have birds
-    est_seconds = clip_count * 2.3 + est_bird_clips * 5
-    est_minutes = est_seconds / 60
-
-    typer.echo(f"Processing {clip_count} clips (estimated {est_minutes:.1f} minutes total)")
-    typer.echo(f"Settings: bird_conf={bird_confidence}")
-    typer.echo("")
-
     # Check if birdbird directory already exists with content
     if paths.birdbird_dir.exists():
         # Check if there are any existing clips
-        existing_clips = list(paths.clips_dir.glob("*.avi")) if paths.clips_dir.exists() else []
+        existing_clips = _count_files(paths.clips_dir, ".avi")
         if existing_clips:
             if force:
-                typer.echo(f"Clearing existing {paths.birdbird_dir} ({len(existing_clips)} clips)...")
-                shutil.rmtree(paths.birdbird_dir)
+                typer.echo(f"Clearing existing {paths.birdbird_dir} ({existing_clips} clips)...")
+                _clear_birdbird_dir(paths)
                 typer.echo("")
+            elif not sys.stdin.isatty():
+                typer.echo(
+                    f"Error: {paths.birdbird_dir} already exists with {existing_clips} clips "
+                    "(use --force to clear it when running non-interactively)",
+                    err=True,
+                )
+                raise typer.Exit(1)
             else:
-                typer.echo(f"Warning: {paths.birdbird_dir} already exists with {len(existing_clips)} clips")
+                typer.echo(f"Warning: {paths.birdbird_dir} already exists with {existing_clips} clips")
                 typer.echo("This will mix old and new results, which may cause cache mismatches.")
                 typer.echo("")
                 typer.echo("Options:")
@@ -273,7 +436,7 @@ def process(
 
                 if choice == 1:
                     typer.echo(f"Removing {paths.birdbird_dir}...")
-                    shutil.rmtree(paths.birdbird_dir)
+                    _clear_birdbird_dir(paths)
                 elif choice == 2:
                     typer.echo("Continuing with existing directory (results may be unpredictable)")
                 else:
@@ -281,26 +444,47 @@ def process(
                     raise typer.Exit(0)
                 typer.echo("")
 
+    # Estimate total time from this host's last measured filter and highlights
+    # rates (benchmark defaults until a run has been timed)
+    clips = list_clips(input_dir, limit)
+    clip_count = len(clips)
+    calibration = load_calibration()
+    est_bird_clips = clip_count * calibration["bird_clip_ratio"]
+    est_seconds = (
+        clip_count * calibration["filter_s_per_clip"] / workers
+        + est_bird_clips * calibration["highlights_s_per_bird_clip"]
+    )
+    est_minutes = est_seconds / 60
+
+    typer.echo(f"Processing {clip_count} clips (estimated {est_minutes:.1f} minutes total)")
+    typer.echo(f"Settings: bird_conf={bird_confidence}")
+    typer.echo("")
+
     # Ensure directories exist
     paths.ensure_working_dirs()
     paths.ensure_assets_dirs()
 
-    # Calculate original duration before filtering
-    typer.echo("Calculating original duration...")
-    clips_to_process = clips[:clip_count]
-    original_duration = sum(get_video_duration(c) for c in clips_to_process)
-    typer.echo("")
+    # Calculate original duration before filtering (only used in the summary)
+    original_duration: float | None = None
+    if not skip_original_duration:
+        typer.echo("Calculating original duration...")
+        original_duration = total_video_duration(clips, paths.durations_json)
+        typer.echo("")
 
     # Determine total steps
     total_steps = 4 if run_species else 3
 
     # Step 1: Filter
     typer.echo(f"Step 1/{total_steps}: Filtering clips...")
+    filter_start = time.perf_counter()
     filter_stats = filter_clips(
         input_dir,
         bird_confidence=bird_confidence,
-        limit=limit,
+        clips=clips,
+        paths=paths,
+        workers=workers,
     )
+    filter_elapsed = time.perf_counter() - filter_start
 
     pct = 100 * filter_stats["with_birds"] / filter_stats["total"] if filter_stats["total"] > 0 else 0
     typer.echo(f"  Found {filter_stats['with_birds']}/{filter_stats['total']} clips with birds ({pct:.1f}%)")
@@ -317,6 +501,7 @@ def process(
         output = paths.highlights_mp4
 
     try:
+        highlights_start = time.perf_counter()
         highlights_stats = generate_highlights(
             input_dir=paths.clips_dir,
             output_path=output,
@@ -327,11 +512,17 @@ def process(
             optimize_web=not highest_quality,
             original_duration=original_duration,
             paths=paths,
+            clips=filter_stats["clips"],
         )
 
+        original_msg = (
+            f" filtered from {format_duration(original_duration)} original"
+            if original_duration is not None
+            else " filtered"
+        )
         typer.echo("")
         typer.echo(
-            f"  Duration:   {format_duration(highlights_stats.final_duration)} highlights from {format_duration(highlights_stats.bird_clips_duration)} filtered from {format_duration(original_duration)} original"
+            f"  Duration:   {format_duration(highlights_stats.final_duration)} highlights from {format_duration(highlights_stats.bird_clips_duration)}{original_msg}"
         )
         typer.echo("")
 
@@ -339,54 +530,52 @@ def process(
         typer.echo(f"Error generating highlights: {e}", err=True)
         raise typer.Exit(1)
 
+    # Record this host's rates so the next run's estimate reflects them
+    # (the filter rate only counts clips not answered from the detection cache)
+    calibration_update = {
+        "highlights_s_per_bird_clip": (time.perf_counter() - highlights_start) / filter_stats["with_birds"],
+        "bird_clip_ratio": filter_stats["with_birds"] / filter_stats["total"],
+    }
+    if filter_stats["scanned"]:
+        calibration_update["filter_s_per_clip"] = filter_elapsed * workers / filter_stats["scanned"]
+    save_calibration(**calibration_update)
+
     # Step 3: Analyze songs
     typer.echo(f"Step 3/{total_steps}: Analyzing bird songs...")
 
-    # Apply config defaults for location if not provided on CLI
-    if lat is None and lon is None:
-        config_lat, config_lon = get_location()
-        if config_lat is not None and config_lon is not None:
-            lat, lon = config_lat, config_lon
-
-    # Validate location args (both or neither after config applied)
-    if (lat is None) != (lon is None):
-        typer.echo("  Error: --lat and --lon must both be provided for location filtering", err=True)
-        typer.echo("  Skipping songs analysis")
-        typer.echo("")
-    else:
-        # Remove existing songs.json if present
-        if paths.songs_json.exists():
-            paths.songs_json.unlink()
+    # Remove existing songs.json if present
+    if paths.songs_json.exists():
+        paths.songs_json.unlink()
 
-        try:
-            import time
-
-            songs_start = time.perf_counter()
-            songs_results = analyze_songs(
-                input_dir=input_dir,
-                min_confidence=song_confidence,
-                lat=lat,
-                lon=lon,
-                threads=song_threads,
-                limit=limit,
-                extract_clips=not no_song_clips,
-                paths=paths,
-            )
+    try:
+        songs_start = time.perf_counter()
+        songs_results = analyze_songs(
+            input_dir=input_dir,
+            min_confidence=song_confidence,
+            lat=lat,
+            lon=lon,
+            threads=song_threads,
+            batch_size=song_batch_size,
+            limit=limit,
+            extract_clips=not no_song_clips,
+            paths=paths,
+            clips=clips,
+        )
 
-            # Save results
-            save_song_detections(songs_results, paths.songs_json)
+        # Save results
+        save_song_detections(songs_results, paths.songs_json)
 
-            songs_elapsed = time.perf_counter() - songs_start
-            clips_msg = f", {songs_results['summary']['clips_extracted']} clips" if not no_song_clips else ""
-            typer.echo(
-                f"  Detected {songs_results['summary']['total_detections']} songs ({songs_results['summary']['unique_species']} species{clips_msg}) in {format_duration(songs_elapsed)}"
-            )
-            typer.echo("")
+        songs_elapsed = time.perf_counter() - songs_start
+        clips_msg = f", {songs_results['summary']['clips_extracted']} clips" if not no_song_clips else ""
+        typer.echo(
+            f"  Detected {songs_results['summary']['total_detections']} songs ({songs_results['summary']['unique_species']} species{clips_msg}) in {format_duration(songs_elapsed)}"
+        )
+        typer.echo("")
 
-        except Exception as e:
-            typer.echo(f"  Error analyzing songs: {e}", err=True)
-            typer.echo("  Continuing without songs data")
-            typer.echo("")
+    except Exception as e:
+        typer.echo(f"  Error analyzing songs: {e}", err=True)
+        typer.echo("  Continuing without songs data")
+        typer.echo("")
 
     # Step 4: Species identification (optional)
     if run_species:
@@ -436,19 +625,26 @@ def process(
     # Write local metadata.json
     write_local_metadata(paths, input_dir)
 
+    # One directory read for the summary (write_local_metadata created assets_dir)
+    with os.scandir(paths.assets_dir) as entries:
+        assets = {entry.name for entry in entries}
+    has_song_clips = paths.song_clips_dir.name in assets and any(
+        name.endswith(".wav") for name in os.listdir(paths.song_clips_dir)
+    )
+
     typer.echo("Complete!")
     typer.echo("  Working:")
     typer.echo(f"    Clips:        {paths.clips_dir}/")
     typer.echo(f"    Detections:   {paths.detections_json}")
     typer.echo("  Assets:")
     typer.echo(f"    Highlights:   {paths.highlights_mp4}")
-    if paths.songs_json.exists():
+    if paths.songs_json.name in assets:
         typer.echo(f"    Songs:        {paths.songs_json}")
-    if paths.song_clips_dir.exists() and list(paths.song_clips_dir.glob("*.wav")):
+    if has_song_clips:
         typer.echo(f"    Song clips:   {paths.song_clips_dir}/")
-    if paths.species_json.exists():
+    if paths.species_json.name in assets:
         typer.echo(f"    Species:      {paths.species_json}")
-    if paths.best_clips_json.exists():
+    if paths.best_clips_json.name in assets:
         typer.echo(f"    Best clips:   {paths.best_clips_json}")
 
 
@@ -471,7 +667,7 @@ def frames(
         typer.echo(f"Error: {input_dir} is not a directory", err=True)
         raise typer.Exit(1)
 
-    from .frames import copy_top_frames_to_assets
+    from .frames import copy_top_frames_to_assets, extract_and_score_frames, save_frame_metadata, save_top_frames
     from .paths import BirdbirdPaths, load_detections
 
     paths = BirdbirdPaths.from_input_dir(input_dir)
@@ -491,20 +687,25 @@ def frames(
 
     # Check if frames directory already exists with content
     if paths.frames_candidates_dir.exists():
-        existing_frames = list(paths.frames_candidates_dir.glob("frame_*.jpg"))
+        existing_frames = _count_files(paths.frames_candidates_dir, ".jpg", prefix="frame_")
         if existing_frames:
             if force:
-                typer.echo(
-                    f"Clearing existing frames from {paths.frames_candidates_dir} ({len(existing_frames)} frames)..."
-                )
-                for frame_file in existing_frames:
-                    frame_file.unlink()
+                typer.echo(f"Clearing existing frames from {paths.frames_candidates_dir} ({existing_frames} frames)...")
+                _remove_tree_in_background(paths.frames_candidates_dir)
+                paths.frames_candidates_dir.mkdir(parents=True, exist_ok=True)
                 # Also remove metadata if it exists
                 if paths.frame_scores_json.exists():
                     paths.frame_scores_json.unlink()
                 typer.echo("")
+            elif not sys.stdin.isatty():
+                typer.echo(
+                    f"Error: {paths.frames_candidates_dir} already exists with {existing_frames} frames "
+                    "(use --force to clear them when running non-interactively)",
+                    err=True,
+                )
+                raise typer.Exit(1)
             else:
-                typer.echo(f"Warning: {paths.frames_candidates_dir} already exists with {len(existing_frames)} frames")
+                typer.echo(f"Warning: {paths.frames_candidates_dir} already exists with {existing_frames} frames")
                 typer.echo("")
                 typer.echo("Options:")
                 typer.echo("  1. Clear and re-extract (recommended)")
@@ -516,8 +717,8 @@ def frames(
 
                 if choice == 1:
                     typer.echo(f"Removing existing frames from {paths.frames_candidates_dir}...")
-                    for frame_file in existing_frames:
-                        frame_file.unlink()
+                    _remove_tree_in_background(paths.frames_candidates_dir)
+                    paths.frames_candidates_dir.mkdir(parents=True, exist_ok=True)
                     if paths.frame_scores_json.exists():
                         paths.frame_scores_json.unlink()
                     typer.echo("")
@@ -541,8 +742,6 @@ def frames(
     typer.echo("")
 
     # Track total wall clock time
-    import time
-
     start_time = time.perf_counter()
 
     # Scoring weights (tunable parameters)
@@ -632,6 +831,7 @@ def publish(
     new_batch: bool = typer.Option(
         False, "--new-batch", "-n", help="Create new batch sequence (for additional footage same day)"
     ),
+    upload_workers: int = typer.Option(8, "--upload-workers", min=1, help="Concurrent uploads to cloud storage"),
 ) -> None:
     """Publish highlights to cloud storage (Cloudflare R2, AWS S3, or S3-compatible).
 
@@ -642,7 +842,6 @@ def publish(
 
     @author Claude Sonnet 4.5 Anthropic
     """
-    import json
 
     # Expand ~ in config_file path
     config_file = Path(config_file).expanduser()
@@ -665,9 +864,8 @@ def publish(
 
     # Load config
     try:
-        with open(config_file) as f:
-            config = json.load(f)
-    except json.JSONDecodeError as e:
+        config = read_json(config_file)
+    except ValueError as e:  # json/orjson JSONDecodeError
         typer.echo(f"Error: Invalid JSON in config file: {e}", err=True)
         raise typer.Exit(1)
 
@@ -679,8 +877,10 @@ def publish(
         raise typer.Exit(1)
 
     # Publish
+    from .publish import publish_to_r2
+
     try:
-        result = publish_to_r2(input_dir, config, create_new_batch=new_batch)
+        result = publish_to_r2(input_dir, config, create_new_batch=new_batch, upload_workers=upload_workers)
 
         typer.echo("")
         typer.echo("Success!")
@@ -715,9 +915,10 @@ def songs(
     input_dir: Path = typer.Argument(..., help="Directory containing .avi clips"),
     output: Path = typer.Option(None, "--output", "-o", help="Output JSON path (default: input_dir/songs.json)"),
     song_confidence: float = typer.Option(0.5, "--song-conf", "-s", help="Min confidence for song detection (0.0-1.0)"),
-    lat: float = typer.Option(None, "--lat", help="Latitude for species filtering (default: from config)"),
-    lon: float = typer.Option(None, "--lon", help="Longitude for species filtering (default: from config)"),
+    lat: float | None = typer.Option(None, "--lat", help="Latitude for species filtering (default: from config)"),
+    lon: float | None = typer.Option(None, "--lon", help="Longitude for species filtering (default: from config)"),
     song_threads: int = typer.Option(2, "--song-threads", help="CPU threads for BirdNET"),
+    song_batch_size: int = typer.Option(8, "--song-batch-size", min=1, help="Audio chunks per BirdNET inference call"),
     limit: int | None = typer.Option(None, "--limit", "-l", help="Max clips to process (for testing)"),
     force: bool = typer.Option(False, "--force", "-f", help="Overwrite existing songs.json without prompting"),
     no_song_clips: bool = typer.Option(False, "--no-song-clips", help="Skip extracting audio clips for each species"),
@@ -737,62 +938,30 @@ def songs(
         typer.echo(f"Error: {input_dir} is not a directory", err=True)
         raise typer.Exit(1)
 
+    # Validate options before touching an existing songs.json
+    _check_confidence(song_confidence, "--song-conf")
+    lat, lon, from_config = _resolve_location(lat, lon)
+
     paths = BirdbirdPaths.from_input_dir(input_dir)
     paths.ensure_assets_dirs()
 
     if output is None:
         output = paths.songs_json
 
-    # Check if output file already exists
-    if output.exists():
-        if force:
-            typer.echo(f"Removing existing {output}...")
-            output.unlink()
-            typer.echo("")
-        else:
-            typer.echo(f"Warning: {output} already exists")
-            typer.echo("")
-            typer.echo("Options:")
-            typer.echo("  1. Remove and re-analyze (recommended)")
-            typer.echo("  2. Cancel")
-            typer.echo("")
-
-            choice = typer.prompt("Choose option", type=int, default=1)
-
-            if choice == 1:
-                typer.echo(f"Removing {output}...")
-                output.unlink()
-                typer.echo("")
-            else:
-                typer.echo("Cancelled")
-                raise typer.Exit(0)
-
-    # Apply config defaults for location if not provided on CLI
-    if lat is None and lon is None:
-        config_lat, config_lon = get_location()
-        if config_lat is not None and config_lon is not None:
-            lat, lon = config_lat, config_lon
-
-    # Validate location args (both or neither after config applied)
-    if (lat is None) != (lon is None):
-        typer.echo("Error: --lat and --lon must both be provided for location filtering", err=True)
-        raise typer.Exit(1)
+    _confirm_overwrite(output, force, "re-analyze")
 
     # Count clips
-    clips = sorted(input_dir.glob("*.avi"))
+    clips = list_clips(input_dir)
     clip_count = min(len(clips), limit) if limit else len(clips)
 
     typer.echo(f"Analyzing bird songs in {clip_count} clips from {input_dir}")
-    typer.echo(f"Settings: song_conf={song_confidence}, song_threads={song_threads}")
+    typer.echo(f"Settings: song_conf={song_confidence}, song_threads={song_threads}, song_batch_size={song_batch_size}")
     if lat is not None and lon is not None:
-        # Check if location came from config (compare with config values)
-        config_lat, config_lon = get_location()
-        from_config = lat == config_lat and lon == config_lon
         source = " (from config)" if from_config else ""
         typer.echo(f"Location filter: lat={lat}, lon={lon}{source}")
     typer.echo("")
 
-    import time
+    from .songs import analyze_songs, save_song_detections
 
     start_time = time.perf_counter()
 
@@ -803,9 +972,11 @@ def songs(
             lat=lat,
             lon=lon,
             threads=song_threads,
+            batch_size=song_batch_size,
             limit=limit,
             extract_clips=not no_song_clips,
             paths=paths,
+            clips=clips,
         )
 
         # Save results
@@ -884,34 +1055,14 @@ def best_clips(
         paths.ensure_assets_dirs()
         output = paths.best_clips_json
 
-    # Check if output file already exists
-    if output.exists():
-        if force:
-            typer.echo(f"Removing existing {output}...")
-            output.unlink()
-            typer.echo("")
-        else:
-            typer.echo(f"Warning: {output} already exists")
-            typer.echo("")
-            typer.echo("Options:")
-            typer.echo("  1. Remove and regenerate (recommended)")
-            typer.echo("  2. Cancel")
-            typer.echo("")
-
-            choice = typer.prompt("Choose option", type=int, default=1)
-
-            if choice == 1:
-                typer.echo(f"Removing {output}...")
-                output.unlink()
-                typer.echo("")
-            else:
-                typer.echo("Cancelled")
-                raise typer.Exit(0)
+    _confirm_overwrite(output, force, "regenerate")
 
     typer.echo(f"Finding best clips from {species_json_path}")
     typer.echo(f"Settings: window_duration={window_duration}s")
     typer.echo("")
 
+    from .best_clips import find_all_best_clips, save_best_clips
+
     try:
         best_clips_data = find_all_best_clips(species_json_path, window_duration_s=window_duration)
         save_best_clips(best_clips_data, output, window_duration_s=window_duration)
@@ -924,7 +1075,7 @@ def best_clips(
         if best_clips_data:
             typer.echo("")
             typer.echo("Best clips:")
-            for species, clip in list(best_clips_data.items())[:10]:
+            for species, clip in islice(best_clips_data.items(), 10):
                 typer.echo(
                     f"  {species}: {clip.start_s:.1f}s-{clip.end_s:.1f}s (score: {clip.score:.2f}, {clip.detection_count} detections)"
                 )
@@ -968,6 +1119,16 @@ def species(
         typer.echo(f"Error: {input_dir} is not a directory", err=True)
         raise typer.Exit(1)
 
+    # Validate options before any video or remote GPU work
+    if mode is not None and mode not in ("remote", "local"):
+        typer.echo(f"Error: --mode must be 'remote' or 'local' (got '{mode}')", err=True)
+        raise typer.Exit(1)
+    if samples_per_minute is not None and samples_per_minute <= 0:
+        typer.echo("Error: --samples must be greater than 0", err=True)
+        raise typer.Exit(1)
+    if min_confidence is not None:
+        _check_confidence(min_confidence, "--min-conf")
+
     # Find highlights.mp4 using BirdbirdPaths
     paths = BirdbirdPaths.from_input_dir(input_dir)
     highlights_path = paths.highlights_mp4
@@ -980,29 +1141,7 @@ def species(
     if output is None:
         output = paths.species_json
 
-    # Check if output file already exists
-    if output.exists():
-        if force:
-            typer.echo(f"Removing existing {output}...")
-            output.unlink()
-            typer.echo("")
-        else:
-            typer.echo(f"Warning: {output} already exists")
-            typer.echo("")
-            typer.echo("Options:")
-            typer.echo("  1. Remove and re-analyze (recommended)")
-            typer.echo("  2. Cancel")
-            typer.echo("")
-
-            choice = typer.prompt("Choose option", type=int, default=1)
-
-            if choice == 1:
-                typer.echo(f"Removing {output}...")
-                output.unlink()
-                typer.echo("")
-            else:
-                typer.echo("Cancelled")
-                raise typer.Exit(0)
+    _confirm_overwrite(output, force, "re-analyze")
 
     # Load config and apply CLI overrides
     config = get_species_config()
@@ -1027,6 +1166,9 @@ def species(
     def progress_callback(msg: str) -> None:
         typer.echo(f"  {msg}")
 
+    from .best_clips import find_all_best_clips, save_best_clips
+    from .species import identify_species, save_species_results
+
     try:
         results = identify_species(
             highlights_path=highlights_path,
@@ -1064,7 +1206,7 @@ def species(
         if results.species_summary:
             typer.echo("")
             typer.echo("Species breakdown:")
-            for species_name, data in list(results.species_summary.items())[:10]:
+            for species_name, data in islice(results.species_summary.items(), 10):
                 typer.echo(f"  {species_name}: {data['count']} ({data['avg_confidence'] * 100:.0f}% avg)")
             if len(results.species_summary) > 10:
                 typer.echo(f"  ... and {len(results.species_summary) - 10} more species")
@@ -5,10 +5,20 @@
 
 import json
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 CONFIG_PATH = Path.home() / ".birdbird" / "config.json"
+CALIBRATION_PATH = Path.home() / ".birdbird" / "calibration.json"
+
+# Timing estimates from the original benchmarks, used until this host has
+# recorded its own (filter time is per clip per detection worker)
+DEFAULT_CALIBRATION = {
+    "filter_s_per_clip": 2.3,
+    "highlights_s_per_bird_clip": 5.0,
+    "bird_clip_ratio": 0.3,
+}
 
 # Default labels file bundled with package
 DEFAULT_LABELS_FILE = Path(__file__).parent / "data" / "uk_garden_birds.txt"
@@ -54,15 +64,24 @@ class SpeciesConfig:
 def load_config() -> dict[str, Any]:
     """Load configuration from ~/.birdbird/config.json.
 
-    Returns empty dict if file doesn't exist or is invalid.
+    Returns empty dict if file doesn't exist or is invalid. The parsed file is
+    cached until it changes on disk, so repeated lookups cost only a stat.
+    Callers must treat the returned dict as read-only.
 
     @author Claude Opus 4.5 Anthropic
     """
-    if not CONFIG_PATH.exists():
+    try:
+        st = CONFIG_PATH.stat()
+    except OSError:
         return {}
+    return _read_config(CONFIG_PATH, st.st_mtime_ns, st.st_size)
+
 
+@lru_cache(maxsize=1)
+def _read_config(config_path: Path, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse the config file; mtime_ns and size only key the cache."""
     try:
-        with open(CONFIG_PATH) as f:
+        with open(config_path) as f:
             result: dict[str, Any] = json.load(f)
             return result
     except (json.JSONDecodeError, OSError):
@@ -126,3 +145,43 @@ def get_species_config() -> SpeciesConfig:
         processing_mode=processing.get("mode", "local"),
         remote=remote_config,
     )
+
+
+def load_calibration() -> dict[str, float]:
+    """Load per-host timing calibration from ~/.birdbird/calibration.json.
+
+    Missing, invalid or non-numeric entries fall back to DEFAULT_CALIBRATION.
+
+    Returns:
+        Dict with every DEFAULT_CALIBRATION key
+    """
+    calibration = dict(DEFAULT_CALIBRATION)
+    try:
+        with open(CALIBRATION_PATH) as f:
+            stored = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return calibration
+
+    if isinstance(stored, dict):
+        for key, value in stored.items():
+            if key in calibration and isinstance(value, (int, float)) and value > 0:
+                calibration[key] = float(value)
+    return calibration
+
+
+def save_calibration(**measurements: float) -> None:
+    """Merge measured timings into ~/.birdbird/calibration.json.
+
+    Estimates are advisory, so failures to write are silently ignored.
+
+    Args:
+        measurements: Values to record, keyed as in DEFAULT_CALIBRATION
+    """
+    calibration = load_calibration()
+    calibration.update({key: round(value, 3) for key, value in measurements.items() if key in calibration})
+    try:
+        CALIBRATION_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(CALIBRATION_PATH, "w") as f:
+            json.dump(calibration, f, indent=2)
+    except OSError:
+        pass
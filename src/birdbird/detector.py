@@ -3,13 +3,53 @@
 @author Claude Opus 4.5 Anthropic
 """
 
+import queue
+import threading
+from collections.abc import Iterator
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 import cv2
 import numpy as np
 from ultralytics import YOLO
 
+MODEL_INPUT_SIZE = 640  # yolov8n default imgsz
+
+# Bump when sampling or preprocessing changes which frames the model sees,
+# so cached per-clip results from older versions are not reused
+DETECTION_VERSION = 2
+
+
+def resize_for_model(frame: np.ndarray) -> np.ndarray:
+    """Downscale frame so its long side matches the YOLO input size.
+
+    YOLO letterboxes to MODEL_INPUT_SIZE internally anyway; resizing first with
+    INTER_AREA shrinks the data pushed through preprocessing. Only class
+    confidences are used, so box coordinates don't need remapping.
+    """
+    h, w = frame.shape[:2]
+    scale = MODEL_INPUT_SIZE / max(h, w)
+    if scale >= 1:
+        return frame
+    return cv2.resize(frame, (round(w * scale), round(h * scale)), interpolation=cv2.INTER_AREA)
+
+
+@lru_cache(maxsize=4)
+def _load_model(weights: str) -> YOLO:
+    """Load YOLO weights once per process and share them between detectors."""
+    return YOLO(weights)
+
+
+@lru_cache(maxsize=1)
+def _cuda_available() -> bool:
+    """Whether YOLO will run on a CUDA device (ultralytics picks it by default)."""
+    try:
+        import torch
+    except ImportError:
+        return False
+    return bool(torch.cuda.is_available())
+
 
 @dataclass
 class Detection:
@@ -26,9 +66,40 @@ class BirdDetector:
     def __init__(
         self,
         bird_confidence: float = 0.2,
+        batch_size: int = 4,
     ):
         self.bird_confidence = bird_confidence
-        self.model = YOLO("yolov8n.pt")
+        # Sampled video frames scored per model call (4 = the first second's samples)
+        self.batch_size = max(1, batch_size)
+        self.model = _load_model("yolov8n.pt")
+        # FP16 roughly doubles GPU throughput; CPU inference stays FP32
+        self.half = _cuda_available()
+
+    def _first_bird(self, result, timestamp: float) -> Detection | None:
+        """Return the first qualifying bird box in a YOLO result, if any."""
+        boxes = result.boxes
+        if boxes is None or len(boxes) == 0:
+            return None
+        # One host copy of all boxes, then a vectorized class/threshold mask
+        # instead of converting each tensor element in a Python loop
+        boxes = boxes.cpu().numpy()
+        hits = np.flatnonzero((boxes.cls == self.BIRD_CLASS_ID) & (boxes.conf >= self.bird_confidence))
+        if hits.size == 0:
+            return None
+        return Detection(timestamp, float(boxes.conf[hits[0]]))
+
+    def _detect_in_batch(self, batch: list[tuple[float, np.ndarray]]) -> Detection | None:
+        """Score several sampled frames in one model call; return the earliest hit.
+
+        Args:
+            batch: (timestamp, frame) pairs in video order
+        """
+        results = self.model([frame for _, frame in batch], verbose=False, half=self.half)
+        for (timestamp, _), result in zip(batch, results):
+            detection = self._first_bird(result, timestamp)
+            if detection:
+                return detection
+        return None
 
     def detect_in_frame(self, frame: np.ndarray) -> bool:
         """Check if a frame contains a bird.
@@ -51,16 +122,11 @@ class BirdDetector:
         Returns:
             Detection with timestamp and confidence, or None if no detection
         """
-        results = self.model(frame, verbose=False)
+        results = self.model(frame, verbose=False, half=self.half)
         for result in results:
-            boxes = result.boxes
-            if boxes is None:
-                continue
-            for cls, conf in zip(boxes.cls, boxes.conf):
-                cls_id = int(cls)
-                conf_val = float(conf)
-                if cls_id == self.BIRD_CLASS_ID and conf_val >= self.bird_confidence:
-                    return Detection(timestamp, conf_val)
+            detection = self._first_bird(result, timestamp)
+            if detection:
+                return detection
         return None
 
     def detect_in_video(self, video_path: Path) -> bool:
@@ -78,7 +144,8 @@ class BirdDetector:
         """Check if a video contains birds and return first detection details.
 
         Uses weighted sampling: ~4 samples in first second (where motion
-        triggered), then 1fps for the remainder.
+        triggered), then 1fps for the remainder. Samples are scored in
+        batches of batch_size, stopping after the first batch with a hit.
 
         Args:
             video_path: Path to video file
@@ -90,6 +157,34 @@ class BirdDetector:
         if not cap.isOpened():
             return None
 
+        # Decode on a separate thread so the next batch is being sampled while
+        # the model scores the current one (cv2 and torch both release the GIL)
+        batches: queue.Queue[list[tuple[float, np.ndarray]] | Exception | None] = queue.Queue(maxsize=2)
+        stop = threading.Event()
+        decoder = threading.Thread(target=self._decode_batches, args=(cap, batches, stop), daemon=True)
+        decoder.start()
+
+        batch: list[tuple[float, np.ndarray]] | Exception | None = []
+        try:
+            while (batch := batches.get()) is not None:
+                if isinstance(batch, Exception):
+                    # Decoding failed: raise here rather than report "no bird"
+                    raise batch
+                detection = self._detect_in_batch(batch)
+                if detection:
+                    return detection
+            return None
+        finally:
+            stop.set()
+            # Drain so a decoder blocked on a full queue can reach its sentinel
+            # (a decoder error is always followed by the sentinel)
+            while batch is not None:
+                batch = batches.get()
+            decoder.join()
+            cap.release()
+
+    def _sampled_frames(self, cap: cv2.VideoCapture) -> Iterator[tuple[float, np.ndarray]]:
+        """Yield (timestamp, frame) for the weighted sample of an open video."""
         video_fps = cap.get(cv2.CAP_PROP_FPS)
         first_second_frames = int(video_fps)  # frames in first second
         # Sample ~4 times in first second, then 1fps after
@@ -97,23 +192,49 @@ class BirdDetector:
         late_interval = max(1, int(video_fps))  # every 1s
         frame_count = 0
 
-        try:
-            while True:
-                ret, frame = cap.read()
+        # grab() advances without converting the frame to BGR; only the
+        # sampled frames are retrieve()d
+        while cap.grab():
+            # Denser sampling in first second, 1fps after
+            interval = early_interval if frame_count < first_second_frames else late_interval
+
+            if frame_count % interval == 0:
+                ret, frame = cap.retrieve()
                 if not ret:
-                    break
+                    return
+                # Resize here, off the inference thread, which also keeps queued batches small
+                yield frame_count / video_fps, resize_for_model(frame)
 
-                # Denser sampling in first second, 1fps after
-                interval = early_interval if frame_count < first_second_frames else late_interval
+            frame_count += 1
 
-                if frame_count % interval == 0:
-                    timestamp = frame_count / video_fps
-                    detection = self.detect_in_frame_detailed(frame, timestamp)
-                    if detection:
-                        return detection
+    def _decode_batches(
+        self,
+        cap: cv2.VideoCapture,
+        batches: queue.Queue,
+        stop: threading.Event,
+    ) -> None:
+        """Decoder thread: queue sampled frames in batches, ending with None.
 
-                frame_count += 1
-        finally:
-            cap.release()
+        An exception raised while decoding is queued ahead of the sentinel so
+        the consumer can re-raise it.
 
-        return None
+        Args:
+            cap: Open video capture (released by the consumer)
+            batches: Bounded queue shared with the consumer
+            stop: Set by the consumer once it no longer needs frames
+        """
+        try:
+            batch: list[tuple[float, np.ndarray]] = []
+            for sample in self._sampled_frames(cap):
+                if stop.is_set():
+                    return
+                batch.append(sample)
+                if len(batch) == self.batch_size:
+                    batches.put(batch)
+                    batch = []
+            if batch:
+                batches.put(batch)
+        except Exception as e:
+            batches.put(e)
+        finally:
+            batches.put(None)
@@ -4,83 +4,266 @@
 """
 
 import json
+import multiprocessing
 import os
 import shutil
+from collections.abc import Generator, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 from tqdm import tqdm
 
-from .detector import BirdDetector
-from .paths import BirdbirdPaths
+from .detector import DETECTION_VERSION, BirdDetector, Detection
+from .paths import BirdbirdPaths, list_clips, write_json
 
 
 def create_symlink_or_copy(src: Path, dst: Path) -> None:
     """Create symlink to src at dst. Falls back to copy on Windows/errors.
 
+    An existing dst is left as is (a link from an earlier run).
+
     Args:
         src: Source file path
         dst: Destination path for symlink or copy
     """
     try:
         os.symlink(src, dst)
+    except FileExistsError:
+        return
     except (OSError, NotImplementedError):
         # Windows or filesystem doesn't support symlinks
         shutil.copy2(src, dst)
 
 
+# Per-process detector, created once by _init_worker in each pool worker
+_worker_detector: BirdDetector | None = None
+
+
+def _init_worker(bird_confidence: float) -> None:
+    """Load the YOLO model once per worker process."""
+    global _worker_detector
+    _worker_detector = BirdDetector(bird_confidence=bird_confidence)
+
+
+def _detect_clip(clip_path: Path) -> Detection | None:
+    """Run detection on one clip using the worker's detector."""
+    assert _worker_detector is not None
+    return _worker_detector.detect_in_video_detailed(clip_path)
+
+
+def _detect_clips(
+    clips: list[Path],
+    bird_confidence: float,
+    workers: int,
+) -> Generator[tuple[Path, Detection | None], None, None]:
+    """Yield (clip, detection) pairs in clip order.
+
+    With workers > 1, clips are decoded and scored in a process pool where
+    each worker holds its own model; results still arrive in input order.
+    Workers are spawned rather than forked: the parent has other threads
+    running (tqdm's monitor, background tree deletion) and may have
+    initialised torch/CUDA, neither of which is fork-safe.
+
+    Args:
+        clips: Clips to scan
+        bird_confidence: Minimum confidence threshold for bird detection
+        workers: Number of detection processes (1 = run in this process)
+    """
+    if workers <= 1:
+        detector = BirdDetector(bird_confidence=bird_confidence)
+        for clip_path in clips:
+            yield clip_path, detector.detect_in_video_detailed(clip_path)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(bird_confidence,),
+    ) as executor:
+        yield from zip(clips, executor.map(_detect_clip, clips))
+
+
+def _cache_key(clip_path: Path, bird_confidence: float) -> str | None:
+    """Identify a clip's content, threshold and detector version for the detection cache (None if unreadable)."""
+    try:
+        st = clip_path.stat()
+    except OSError:
+        return None
+    return f"{clip_path.name}:{st.st_mtime_ns}:{st.st_size}:{bird_confidence}:v{DETECTION_VERSION}"
+
+
+def _load_detection_cache(cache_path: Path) -> dict[str, list[float] | None]:
+    """Read the detection cache journal into a dict (missing file = empty cache).
+
+    Each line is a [key, entry] pair. Unparseable lines, such as one cut off
+    by an interrupted run, are skipped; later lines win for repeated keys.
+
+    Args:
+        cache_path: Path to detection_cache.jsonl
+    """
+    cache: dict[str, list[float] | None] = {}
+    try:
+        with open(cache_path) as f:
+            for line in f:
+                try:
+                    key, entry = json.loads(line)
+                except ValueError:
+                    continue
+                cache[key] = entry
+    except OSError:
+        pass
+    return cache
+
+
+def _merge_cached(
+    clips: list[Path],
+    keys: dict[Path, str | None],
+    cache: dict[str, list[float] | None],
+    fresh: Generator[tuple[Path, Detection | None], None, None],
+    journal: TextIO,
+) -> Iterator[tuple[Path, Detection | None]]:
+    """Yield (clip, detection) pairs in clip order, taking cache misses from fresh.
+
+    Results for newly scanned clips are added to cache in place and appended
+    to journal as they arrive, so an interrupted run keeps everything scanned
+    so far.
+
+    Args:
+        clips: All clips, in order
+        keys: _cache_key for each clip
+        cache: Mapping of cache key to [timestamp, confidence], or None for no bird
+        fresh: Detection results for the clips missing from cache, in order
+        journal: Line-buffered detection cache file opened for appending
+    """
+    with closing(fresh):
+        for clip_path in clips:
+            key = keys[clip_path]
+            if key is not None and key in cache:
+                entry = cache[key]
+                yield clip_path, Detection(*entry) if entry else None
+                continue
+
+            _, detection = next(fresh)
+            if key is not None:
+                cache[key] = [detection.timestamp, detection.confidence] if detection else None
+                journal.write(json.dumps([key, cache[key]]) + "\n")
+            yield clip_path, detection
+
+
+def _compact_detection_cache(
+    cache_path: Path,
+    cache: dict[str, list[float] | None],
+    keys: dict[Path, str | None],
+    clip_names: set[str],
+) -> None:
+    """Rewrite the journal keeping only entries a later run could still hit.
+
+    Drops entries from older detector versions, for clips no longer in the
+    input directory, and for clips in this run whose content has changed.
+    Entries for other thresholds are kept. Rewritten via a temp file, so an
+    interruption leaves the old journal in place.
+
+    Args:
+        cache_path: Path to detection_cache.jsonl
+        cache: All entries after this run (loaded plus newly scanned)
+        keys: _cache_key for each clip in this run
+        clip_names: Names of the .avi clips currently in the input directory
+    """
+    # name:mtime:size for each clip this run could stat
+    current = {clip_path.name: key.rsplit(":", 2)[0] for clip_path, key in keys.items() if key is not None}
+    version = f":v{DETECTION_VERSION}"
+
+    live: dict[str, list[float] | None] = {}
+    for key, entry in cache.items():
+        name = key.rsplit(":", 4)[0]
+        if not key.endswith(version) or name not in clip_names:
+            continue
+        if name in current and key.rsplit(":", 2)[0] != current[name]:
+            continue
+        live[key] = entry
+
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        f.writelines(json.dumps([key, entry]) + "\n" for key, entry in live.items())
+    os.replace(tmp_path, cache_path)
+
+
 def filter_clips(
     input_dir: Path,
     bird_confidence: float = 0.2,
     limit: int | None = None,
+    clips: list[Path] | None = None,
+    paths: BirdbirdPaths | None = None,
+    workers: int = 1,
 ) -> dict:
     """Filter clips to keep only those containing birds.
 
     Saves detection metadata to detections.json in the working filter directory.
+    Per-clip YOLO results are appended to detection_cache.jsonl keyed by clip
+    name, mtime, size, threshold and detector version, so re-runs (including
+    after a crash or process --force) only scan new or changed clips.
     Creates symlinks to filtered clips (falls back to copies on Windows).
 
     Args:
         input_dir: Directory containing .avi clips
         bird_confidence: Minimum confidence threshold for bird detection
         limit: Maximum number of clips to process (for testing)
+        clips: Optional pre-enumerated clip list (skips rescanning input_dir)
+        paths: Optional BirdbirdPaths object (constructed if not provided)
+        workers: Parallel detection processes, each loading its own model
 
     Returns:
-        Dict with counts: total, with_birds, filtered_out, and paths object
+        Dict with counts: total, with_birds, filtered_out, scanned (cache
+        misses run through YOLO), plus the filtered clip paths (clips) and
+        paths object
     """
     input_dir = Path(input_dir)
-    paths = BirdbirdPaths.from_input_dir(input_dir)
+    if paths is None:
+        paths = BirdbirdPaths.from_input_dir(input_dir)
     paths.ensure_working_dirs()
 
-    clips = sorted(input_dir.glob("*.avi"))
-    if limit:
-        clips = clips[:limit]
-
-    detector = BirdDetector(
-        bird_confidence=bird_confidence,
-    )
+    if clips is None:
+        clips = list_clips(input_dir, limit)
 
     stats: dict[str, Any] = {"total": len(clips), "with_birds": 0, "filtered_out": 0}
     detections: dict[str, dict] = {}
+    bird_clips: list[Path] = []
 
-    for clip_path in tqdm(clips, desc="Processing clips"):
-        detection = detector.detect_in_video_detailed(clip_path)
+    # Reuse YOLO results for clips unchanged since an earlier run at this threshold
+    cache = _load_detection_cache(paths.detection_cache_jsonl)
 
-        if detection:
-            stats["with_birds"] += 1
-            dest = paths.clips_dir / clip_path.name
-            if not dest.exists():
+    keys = {clip_path: _cache_key(clip_path, bird_confidence) for clip_path in clips}
+    misses = [clip_path for clip_path in clips if keys[clip_path] not in cache]
+    stats["scanned"] = len(misses)
+
+    with open(paths.detection_cache_jsonl, "a", buffering=1) as journal:
+        results = _merge_cached(clips, keys, cache, _detect_clips(misses, bird_confidence, workers), journal)
+        for clip_path, detection in tqdm(results, total=len(clips), desc="Processing clips"):
+            if detection:
+                stats["with_birds"] += 1
+                dest = paths.clips_dir / clip_path.name
                 create_symlink_or_copy(clip_path, dest)
-            # Save detection metadata
-            detections[clip_path.name] = {
-                "first_bird": detection.timestamp,
-                "confidence": round(detection.confidence, 3),
-            }
-        else:
-            stats["filtered_out"] += 1
+                bird_clips.append(dest)
+                # Save detection metadata
+                detections[clip_path.name] = {
+                    "first_bird": detection.timestamp,
+                    "confidence": round(detection.confidence, 3),
+                }
+            else:
+                stats["filtered_out"] += 1
+
+    # The pass completed, so compact what it appended (the journal only
+    # grows on runs with misses, which keeps it bounded)
+    if misses:
+        clip_names = {clip.name for clip in list_clips(input_dir)}
+        _compact_detection_cache(paths.detection_cache_jsonl, cache, keys, clip_names)
 
     # Write detections metadata
-    with open(paths.detections_json, "w") as f:
-        json.dump(detections, f, indent=2)
+    write_json(paths.detections_json, detections)
 
+    stats["clips"] = bird_clips
     stats["paths"] = paths
     return stats
@@ -3,7 +3,6 @@
 @author Claude Sonnet 4.5 Anthropic
 """
 
-import json
 import shutil
 import time
 from dataclasses import dataclass
@@ -14,7 +13,7 @@ import numpy as np
 from tqdm import tqdm
 
 from .detector import BirdDetector
-from .paths import BirdbirdPaths, get_asset_frame_paths, load_detections
+from .paths import BirdbirdPaths, get_asset_frame_paths, load_detections, read_json, write_json
 
 
 @dataclass
@@ -54,7 +53,7 @@ def calculate_bird_size(detector: BirdDetector, frame: np.ndarray) -> float:
     @author Claude Sonnet 4.5 Anthropic
     """
     # Run YOLO to get bounding boxes
-    results = detector.model(frame, verbose=False)
+    results = detector.model(frame, verbose=False, half=detector.half)
 
     if not results or len(results) == 0:
         return 0.0
@@ -69,21 +68,19 @@ def calculate_bird_size(detector: BirdDetector, frame: np.ndarray) -> float:
         if boxes is None or len(boxes) == 0:
             continue
 
-        for box in boxes:
-            class_id = int(box.cls[0])
-            conf = float(box.conf[0])
-
+        # Copy all boxes to host at once rather than syncing per tensor element
+        boxes = boxes.cpu().numpy()
+        for class_id, conf, (x1, y1, x2, y2) in zip(boxes.cls, boxes.conf, boxes.xyxy):
             # Check if it's a bird detection above threshold
             is_bird = class_id == detector.BIRD_CLASS_ID and conf >= detector.bird_confidence
 
             if is_bird:
-                # Get bbox coordinates (xyxy format)
-                x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
+                # bbox coordinates are in xyxy format
                 bbox_width = x2 - x1
                 bbox_height = y2 - y1
                 bbox_area = bbox_width * bbox_height
                 bbox_ratio = bbox_area / frame_area
-                max_bbox_ratio = max(max_bbox_ratio, bbox_ratio)
+                max_bbox_ratio = max(max_bbox_ratio, float(bbox_ratio))
 
     return max_bbox_ratio
 
@@ -98,7 +95,7 @@ def calculate_position(detector: BirdDetector, frame: np.ndarray) -> float:
     @author Claude Sonnet 4.5 Anthropic
     """
     # Run YOLO to get bounding boxes
-    results = detector.model(frame, verbose=False)
+    results = detector.model(frame, verbose=False, half=detector.half)
 
     if not results or len(results) == 0:
         return 0.0
@@ -113,17 +110,13 @@ def calculate_position(detector: BirdDetector, frame: np.ndarray) -> float:
         if boxes is None or len(boxes) == 0:
             continue
 
-        for box in boxes:
-            class_id = int(box.cls[0])
-            conf = float(box.conf[0])
-
+        # Copy all boxes to host at once rather than syncing per tensor element
+        boxes = boxes.cpu().numpy()
+        for class_id, conf, (x1, y1, x2, y2) in zip(boxes.cls, boxes.conf, boxes.xyxy):
             # Check if it's a bird detection above threshold
             is_bird = class_id == detector.BIRD_CLASS_ID and conf >= detector.bird_confidence
 
             if is_bird:
-                # Get bbox coordinates
-                x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
-
                 # Check if bbox touches problematic edges
                 touches_left = x1 <= edge_threshold
                 touches_right = x2 >= (frame_width - edge_threshold)
@@ -411,8 +404,7 @@ def save_frame_metadata(
         "config": config,
     }
 
-    with open(output_path, "w") as f:
-        json.dump(metadata, f, indent=2)
+    write_json(output_path, metadata)
 
 
 def copy_top_frames_to_assets(
@@ -435,8 +427,7 @@ def copy_top_frames_to_assets(
     @author Claude Sonnet 4.5 Anthropic
     """
     # Load frame_scores.json
-    with open(frame_scores_path) as f:
-        metadata = json.load(f)
+    metadata = read_json(frame_scores_path)
 
     frames = metadata["frames"][:top_n]
     asset_paths = get_asset_frame_paths(assets_dir, top_n)
@@ -3,8 +3,10 @@
 @author Claude Opus 4.5 Anthropic
 """
 
+import os
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -12,7 +14,7 @@ import cv2
 from tqdm import tqdm
 
 from .detector import BirdDetector
-from .paths import BirdbirdPaths, load_detections
+from .paths import BirdbirdPaths, list_clips, load_detections, read_json, write_json
 
 # Cache for hardware encoder availability
 _hardware_encoder_cache = None
@@ -106,6 +108,67 @@ def get_video_duration(video_path: Path) -> float:
     return frame_count / fps if fps > 0 else 0.0
 
 
+def video_durations(clips: list[Path], cache_path: Path | None = None) -> dict[Path, float]:
+    """Get durations of many videos, probing them concurrently.
+
+    Each probe is dominated by opening the file (cv2 releases the GIL), so a
+    small thread pool overlaps the I/O latency. With cache_path, durations are
+    persisted keyed by clip name, mtime and size, so re-runs only probe new or
+    changed clips.
+
+    Args:
+        clips: Video files to measure
+        cache_path: Optional JSON file to read/update cached durations
+
+    Returns:
+        Dict mapping each clip to its duration in seconds
+    """
+    cache: dict[str, float] = {}
+    if cache_path is not None:
+        try:
+            cache = read_json(cache_path)
+        except (OSError, ValueError):
+            cache = {}
+
+    keys: dict[Path, str | None] = {}
+    for clip in clips:
+        try:
+            st = clip.stat()
+            keys[clip] = f"{clip.name}:{st.st_mtime_ns}:{st.st_size}"
+        except OSError:
+            keys[clip] = None
+
+    durations = {clip: cache[key] for clip, key in keys.items() if key in cache}
+    misses = [clip for clip in clips if clip not in durations]
+    if misses:
+        workers = min(8, os.cpu_count() or 1, len(misses))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for clip, duration in zip(misses, executor.map(get_video_duration, misses)):
+                durations[clip] = duration
+                key = keys[clip]
+                if key is not None:
+                    cache[key] = duration
+
+        if cache_path is not None:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            write_json(cache_path, cache)
+
+    return durations
+
+
+def total_video_duration(clips: list[Path], cache_path: Path | None = None) -> float:
+    """Sum durations of many videos (see video_durations).
+
+    Args:
+        clips: Video files to measure
+        cache_path: Optional JSON file to read/update cached durations
+
+    Returns:
+        Total duration in seconds
+    """
+    return sum(video_durations(clips, cache_path).values())
+
+
 def _detect_at_time(cap: cv2.VideoCapture, detector: BirdDetector, time_sec: float, fps: float) -> bool:
     """Seek to a specific time and run detection on that frame."""
     frame_num = int(time_sec * fps)
@@ -424,6 +487,7 @@ def generate_highlights(
     optimize_web: bool = False,
     original_duration: float | None = None,
     paths: BirdbirdPaths | None = None,
+    clips: list[Path] | None = None,
 ) -> HighlightsStats:
     """Generate a highlights reel from bird clips.
 
@@ -437,13 +501,15 @@ def generate_highlights(
         optimize_web: If True, optimize for web viewing (preserve aspect ratio @ 24fps, CRF 23)
         original_duration: Optional pre-calculated original duration (if None, calculates from input_dir)
         paths: Optional BirdbirdPaths object (constructed if not provided)
+        clips: Optional pre-enumerated clip list (skips rescanning input_dir)
 
     Returns:
         HighlightsStats with duration information
 
     @author Claude Sonnet 4.5 Anthropic
     """
-    clips = sorted(input_dir.glob("*.avi"))
+    if clips is None:
+        clips = list_clips(input_dir)
     if not clips:
         raise ValueError(f"No .avi clips found in {input_dir}")
 
@@ -474,9 +540,10 @@ def generate_highlights(
         bird_confidence=bird_confidence,
     )
 
-    # Calculate original duration if not provided
+    # Clip durations (cached across runs); original duration if not provided
+    durations = video_durations(clips, paths.durations_json)
     if original_duration is None:
-        original_duration = sum(get_video_duration(c) for c in clips)
+        original_duration = sum(durations.values())
 
     # Find all segments
     all_segments: list[Segment] = []
@@ -490,7 +557,7 @@ def generate_highlights(
 
         segments = find_bird_segments(clip, detector, buffer_before, buffer_after, known_first_bird)
         if segments:
-            bird_clips_duration += get_video_duration(clip)
+            bird_clips_duration += durations[clip]
             all_segments.extend(segments)
 
     if not all_segments:
@@ -7,11 +7,18 @@ and assets directories (final outputs mirroring R2 structure).
 @author Claude Sonnet 4.5 Anthropic
 """
 
+import heapq
 import json
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional speedup: pip install 'birdbird[fast]'
+    orjson = None  # type: ignore[assignment]
+
 
 @dataclass
 class BirdbirdPaths:
@@ -28,6 +35,9 @@ class BirdbirdPaths:
             │   └── frames/
             │       ├── candidates/      (all scored frames with detailed filenames)
             │       └── frame_scores.json (scoring metadata)
+            ├── cache/                   (kept when process clears old results)
+            │   ├── detection_cache.jsonl (per-clip YOLO results)
+            │   └── durations.json       (cached clip durations)
             └── assets/                  (mirrors R2 structure)
                 ├── highlights.mp4
                 ├── frame_01.jpg         (top 3 frames, simple numbering)
@@ -55,6 +65,11 @@ class BirdbirdPaths:
     frames_candidates_dir: Path
     frame_scores_json: Path
 
+    # Cache directory (survives clearing working/ and assets/)
+    cache_dir: Path
+    detection_cache_jsonl: Path
+    durations_json: Path
+
     # Assets directory (mirrors R2)
     assets_dir: Path
     highlights_mp4: Path
@@ -86,6 +101,11 @@ class BirdbirdPaths:
         frames_candidates_dir = frames_working_dir / "candidates"
         frame_scores_json = frames_working_dir / "frame_scores.json"
 
+        # Cache paths
+        cache_dir = birdbird_dir / "cache"
+        detection_cache_jsonl = cache_dir / "detection_cache.jsonl"
+        durations_json = cache_dir / "durations.json"
+
         # Assets paths
         assets_dir = birdbird_dir / "assets"
         highlights_mp4 = assets_dir / "highlights.mp4"
@@ -105,6 +125,9 @@ class BirdbirdPaths:
             frames_working_dir=frames_working_dir,
             frames_candidates_dir=frames_candidates_dir,
             frame_scores_json=frame_scores_json,
+            cache_dir=cache_dir,
+            detection_cache_jsonl=detection_cache_jsonl,
+            durations_json=durations_json,
             assets_dir=assets_dir,
             highlights_mp4=highlights_mp4,
             metadata_json=metadata_json,
@@ -118,6 +141,7 @@ class BirdbirdPaths:
         """Create all working directories."""
         self.clips_dir.mkdir(parents=True, exist_ok=True)
         self.frames_candidates_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
 
     def ensure_assets_dirs(self) -> None:
         """Create assets directory structure."""
@@ -138,6 +162,58 @@ def get_asset_frame_paths(assets_dir: Path, top_n: int = 3) -> list[Path]:
     return [assets_dir / f"frame_{i:02d}.jpg" for i in range(1, top_n + 1)]
 
 
+def list_clips(directory: Path, limit: int | None = None) -> list[Path]:
+    """List .avi clips in a directory, sorted by filename.
+
+    Uses a single os.scandir pass rather than Path.glob, and compares plain
+    names. With a limit, only the first N names are selected (heapq) instead
+    of sorting the whole directory.
+
+    Args:
+        directory: Directory to scan
+        limit: Maximum number of clips to return (first N by name)
+
+    Returns:
+        Sorted list of clip paths
+    """
+    directory = Path(directory)
+    with os.scandir(directory) as entries:
+        names = [entry.name for entry in entries if entry.name.endswith(".avi") and entry.is_file()]
+    names = heapq.nsmallest(limit, names) if limit else sorted(names)
+    return [directory / name for name in names]
+
+
+def read_json(json_path: Path) -> Any:
+    """Read and parse a JSON file, using orjson when it is installed.
+
+    Args:
+        json_path: Path to JSON file
+
+    Returns:
+        Parsed JSON document
+    """
+    if orjson is not None:
+        with open(json_path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(json_path) as f:
+        return json.load(f)
+
+
+def write_json(json_path: Path, data: Any) -> None:
+    """Write data as indented JSON, using orjson when it is installed.
+
+    Args:
+        json_path: Path to output JSON file
+        data: JSON-serializable document
+    """
+    if orjson is not None:
+        with open(json_path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        return
+    with open(json_path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
 def load_detections(detections_path: Path) -> dict:
     """Load detections.json from path.
 
@@ -156,6 +232,5 @@ def load_detections(detections_path: Path) -> dict:
             f"Detections file not found: {detections_path}\nRun 'birdbird filter' first to generate detections."
         )
 
-    with open(detections_path) as f:
-        result: dict[str, Any] = json.load(f)
-        return result
+    result: dict[str, Any] = read_json(detections_path)
+    return result
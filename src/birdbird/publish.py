@@ -6,15 +6,17 @@
 import hashlib
 import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
 import boto3
 import typer
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 from tqdm import tqdm
 
-from .paths import BirdbirdPaths, load_detections
+from .paths import BirdbirdPaths, list_clips, load_detections, read_json
 
 
 def create_r2_client(config: dict):
@@ -259,7 +261,7 @@ def extract_date_range(input_dir: Path, original_date: str) -> tuple[str, str]:
 
     # Scan all .avi files in input directory
     # This gives us the full date range of the batch, even if some days had no birds
-    avi_files = list(input_dir.glob("*.avi"))
+    avi_files = list_clips(input_dir)
     if not avi_files:
         # No clips found, return single date
         return (original_date, original_date)
@@ -357,6 +359,7 @@ def upload_batch(
     species_path: Path | None = None,
     best_clips_path: Path | None = None,
     batch_exists: bool = False,
+    upload_workers: int = 8,
 ) -> dict:
     """Upload all batch assets to R2.
 
@@ -374,6 +377,7 @@ def upload_batch(
         species_path: Optional path to species.json
         best_clips_path: Optional path to best_clips.json
         batch_exists: Whether batch already exists in R2
+        upload_workers: Concurrent uploads (song clips, and highlights multipart parts)
 
     Returns: metadata dict for this batch
 
@@ -409,26 +413,31 @@ def upload_batch(
                     pbar.update(bytes_amount)
 
                 s3_client.upload_fileobj(
-                    f, bucket_name, highlights_key, ExtraArgs={"ContentType": "video/mp4"}, Callback=upload_callback
+                    f,
+                    bucket_name,
+                    highlights_key,
+                    ExtraArgs={"ContentType": "video/mp4"},
+                    Callback=upload_callback,
+                    Config=TransferConfig(max_concurrency=upload_workers),
                 )
         uploaded_files.append("highlights.mp4")
 
     # Upload songs.json if available
     songs_summary = None
+    songs_data = None
     if songs_path and songs_path.exists():
         songs_key = f"batches/{batch_id}/songs.json"
 
-        with open(songs_path) as songs_f:
-            songs_data = json.load(songs_f)
+        songs_data = read_json(songs_path)
 
         if batch_exists and not should_upload_file(s3_client, bucket_name, songs_key, songs_path):
             typer.echo("  Skipping songs.json (unchanged)")
             skipped_files.append("songs.json")
         else:
             typer.echo("  Uploading songs.json...")
-            # Upload full songs.json
+            # Upload the file as written so its ETag matches the local MD5 next time
             s3_client.put_object(
-                Bucket=bucket_name, Key=songs_key, Body=json.dumps(songs_data, indent=2), ContentType="application/json"
+                Bucket=bucket_name, Key=songs_key, Body=songs_path.read_bytes(), ContentType="application/json"
             )
             uploaded_files.append("songs.json")
 
@@ -446,25 +455,33 @@ def upload_batch(
         if clip_files:
             typer.echo(f"  Checking {len(clip_files)} song clips...")
 
-            # Load songs.json to get clip metadata (species, confidence, etc.)
+            # Clip metadata (species, confidence, etc.) from songs.json loaded above
             clips_data = {}
-            if songs_path and songs_path.exists():
-                with open(songs_path) as clips_meta_f:
-                    songs_json = json.load(clips_meta_f)
-                    for clip in songs_json.get("clips", []):
-                        clips_data[clip["filename"]] = clip
+            if songs_data is not None:
+                for clip in songs_data.get("clips", []):
+                    clips_data[clip["filename"]] = clip
 
-            for clip_file in clip_files:
+            def upload_clip(clip_file: Path) -> bool:
+                """Upload one song clip, returning False if skipped as unchanged."""
                 clip_key = f"batches/{batch_id}/song_clips/{clip_file.name}"
-
                 if batch_exists and not should_upload_file(s3_client, bucket_name, clip_key, clip_file):
+                    return False
+                with open(clip_file, "rb") as clip_f:
+                    s3_client.put_object(Bucket=bucket_name, Key=clip_key, Body=clip_f, ContentType="audio/wav")
+                return True
+
+            # Clips are small objects, so each upload is dominated by request
+            # latency; overlap them on threads (boto3 clients are thread-safe)
+            with ThreadPoolExecutor(max_workers=max(1, upload_workers)) as executor:
+                results = executor.map(upload_clip, clip_files)
+
+            for clip_file, uploaded in zip(clip_files, results):
+                if uploaded:
+                    typer.echo(f"    Uploaded {clip_file.name}")
+                    uploaded_files.append(f"song_clips/{clip_file.name}")
+                else:
                     typer.echo(f"    Skipping {clip_file.name} (unchanged)")
                     skipped_files.append(f"song_clips/{clip_file.name}")
-                else:
-                    typer.echo(f"    Uploading {clip_file.name}")
-                    with open(clip_file, "rb") as clip_f:
-                        s3_client.put_object(Bucket=bucket_name, Key=clip_key, Body=clip_f, ContentType="audio/wav")
-                    uploaded_files.append(f"song_clips/{clip_file.name}")
 
                 # Add metadata from songs.json if available
                 clip_info = clips_data.get(clip_file.name, {})
@@ -501,8 +518,7 @@ def upload_batch(
     if species_path and species_path.exists():
         species_key = f"batches/{batch_id}/species.json"
 
-        with open(species_path) as species_f:
-            species_data = json.load(species_f)
+        species_data = read_json(species_path)
 
         if batch_exists and not should_upload_file(s3_client, bucket_name, species_key, species_path):
             typer.echo("  Skipping species.json (unchanged)")
@@ -512,7 +528,7 @@ def upload_batch(
             s3_client.put_object(
                 Bucket=bucket_name,
                 Key=species_key,
-                Body=json.dumps(species_data, indent=2),
+                Body=species_path.read_bytes(),
                 ContentType="application/json",
             )
             uploaded_files.append("species.json")
@@ -533,8 +549,7 @@ def upload_batch(
     if best_clips_path and best_clips_path.exists():
         best_clips_key = f"batches/{batch_id}/best_clips.json"
 
-        with open(best_clips_path) as best_clips_f:
-            best_clips_data = json.load(best_clips_f)
+        best_clips_data = read_json(best_clips_path)
 
         if batch_exists and not should_upload_file(s3_client, bucket_name, best_clips_key, best_clips_path):
             typer.echo("  Skipping best_clips.json (unchanged)")
@@ -544,7 +559,7 @@ def upload_batch(
             s3_client.put_object(
                 Bucket=bucket_name,
                 Key=best_clips_key,
-                Body=json.dumps(best_clips_data, indent=2),
+                Body=best_clips_path.read_bytes(),
                 ContentType="application/json",
             )
             uploaded_files.append("best_clips.json")
@@ -695,6 +710,7 @@ def publish_to_r2(
     input_dir: Path,
     config: dict,
     create_new_batch: bool = False,
+    upload_workers: int = 8,
 ) -> dict:
     """Main publish orchestration function.
 
@@ -702,6 +718,7 @@ def publish_to_r2(
         input_dir: Directory containing birdbird/ subdirectory with assets
         config: R2 configuration dict
         create_new_batch: If True, create new batch sequence. If False (default), replace existing.
+        upload_workers: Concurrent uploads passed through to upload_batch
 
     Returns: Publication summary dict
 
@@ -824,6 +841,7 @@ def publish_to_r2(
         species_path=species_path,
         best_clips_path=best_clips_path,
         batch_exists=batch_exists,
+        upload_workers=upload_workers,
     )
 
     # Update latest.json
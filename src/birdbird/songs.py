@@ -6,11 +6,12 @@ Extracts audio from AVI files and analyzes for bird vocalizations.
 """
 
 import csv
-import json
 import os
 import subprocess
 import sys
 import tempfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
@@ -19,7 +20,11 @@ from typing import Any
 
 from tqdm import tqdm
 
-from .paths import BirdbirdPaths
+from .paths import BirdbirdPaths, list_clips, write_json
+
+# Clips per BirdNET analyze() call. Each call scores its files in batches, and
+# the progress bar advances between calls.
+ANALYZE_CHUNK_FILES = 50
 
 
 @contextmanager
@@ -248,7 +253,11 @@ def parse_dir_date(input_dir: Path) -> datetime | None:
     return None
 
 
-def validate_timestamps(input_dir: Path, dir_date: datetime | None) -> bool:
+def validate_timestamps(
+    input_dir: Path,
+    dir_date: datetime | None,
+    clips: list[Path] | None = None,
+) -> bool:
     """Check if camera timestamps in filenames are reliable.
 
     Compares day values from filenames against the directory date.
@@ -258,6 +267,7 @@ def validate_timestamps(input_dir: Path, dir_date: datetime | None) -> bool:
     Args:
         input_dir: Directory containing .avi clips
         dir_date: Date parsed from directory name
+        clips: Optional pre-enumerated clip list (skips rescanning input_dir)
 
     Returns:
         True if timestamps appear reliable, False otherwise
@@ -270,7 +280,7 @@ def validate_timestamps(input_dir: Path, dir_date: datetime | None) -> bool:
     dir_day = dir_date.day
 
     # Extract days from filenames (format: DDHHmmss00.avi)
-    avi_files = list(input_dir.glob("*.avi"))
+    avi_files = clips if clips is not None else list_clips(input_dir)
     if not avi_files:
         return False
 
@@ -450,6 +460,8 @@ def analyze_songs(
     limit: int | None = None,
     extract_clips: bool = True,
     paths: BirdbirdPaths | None = None,
+    clips: list[Path] | None = None,
+    batch_size: int = 8,
 ) -> dict:
     """Analyze bird songs from AVI files using BirdNET.
 
@@ -458,10 +470,12 @@ def analyze_songs(
         min_confidence: Minimum confidence threshold (0.0-1.0)
         lat: Latitude for species filtering (optional)
         lon: Longitude for species filtering (optional)
-        threads: Number of CPU threads for BirdNET
+        threads: Number of CPU threads for BirdNET (also caps concurrent audio extractions)
         limit: Max clips to process (for testing)
         extract_clips: Extract audio clips for highest confidence of each species
         paths: Optional BirdbirdPaths object (constructed if not provided)
+        clips: Optional pre-enumerated clip list, before limit (skips rescanning input_dir)
+        batch_size: Number of 3s audio chunks BirdNET scores per inference call
 
     Returns:
         Dict with detections, config, summary, and optionally clips
@@ -477,9 +491,9 @@ def analyze_songs(
     paths.ensure_assets_dirs()
 
     # Find all AVI files
-    avi_files = sorted(input_dir.glob("*.avi"))
-    if limit:
-        avi_files = avi_files[:limit]
+    if clips is None:
+        clips = list_clips(input_dir)
+    avi_files = clips[:limit] if limit else clips
 
     if not avi_files:
         raise ValueError(f"No .avi files found in {input_dir}")
@@ -488,7 +502,7 @@ def analyze_songs(
     dir_date = parse_dir_date(input_dir)
 
     # Validate timestamps (camera clock may be wrong)
-    timestamps_reliable = validate_timestamps(input_dir, dir_date)
+    timestamps_reliable = validate_timestamps(input_dir, dir_date, clips)
     if not timestamps_reliable:
         print("Note: Camera timestamps appear incorrect, using date only")
 
@@ -500,46 +514,67 @@ def analyze_songs(
         audio_dir.mkdir()
         results_dir.mkdir()
 
-        # Extract audio from each AVI file
+        # Extract audio from each AVI file. Each extraction is an ffmpeg
+        # subprocess, so threads are enough to run them side by side.
+        # WAVs go into one subdirectory per BirdNET call (see ANALYZE_CHUNK_FILES)
         print(f"Extracting audio from {len(avi_files)} clips...")
+        wav_paths = [
+            audio_dir / f"{i // ANALYZE_CHUNK_FILES:04d}" / f"{avi_path.stem}.wav"
+            for i, avi_path in enumerate(avi_files)
+        ]
+        for chunk_dir in {wav_path.parent for wav_path in wav_paths}:
+            chunk_dir.mkdir()
+        with ThreadPoolExecutor(max_workers=max(1, threads)) as executor:
+            succeeded = list(
+                tqdm(
+                    executor.map(extract_audio, avi_files, wav_paths),
+                    total=len(avi_files),
+                    desc="Extracting audio",
+                )
+            )
         extracted_files = []
-        for avi_path in tqdm(avi_files, desc="Extracting audio"):
-            wav_path = audio_dir / f"{avi_path.stem}.wav"
-            if extract_audio(avi_path, wav_path):
+        for avi_path, wav_path, ok in zip(avi_files, wav_paths, succeeded):
+            if ok:
                 extracted_files.append((avi_path.name, wav_path))
+            else:
+                # Drop partial output so BirdNET doesn't analyze it
+                wav_path.unlink(missing_ok=True)
 
         if not extracted_files:
             raise ValueError("Failed to extract audio from any clips")
 
         print(f"Extracted audio from {len(extracted_files)} clips")
 
-        # Run BirdNET analysis on each file with progress bar
-        print(f"Running BirdNET analysis (min_conf={min_confidence})...")
+        # Run BirdNET once per chunk directory rather than per file: the model
+        # stays loaded between calls and audio chunks are scored in batches.
+        print(f"Running BirdNET analysis (min_conf={min_confidence}, batch_size={batch_size})...")
+
+        analyze_kwargs = {
+            "output": str(results_dir),
+            "min_conf": min_confidence,
+            "threads": threads,
+            "batch_size": batch_size,
+            "rtype": "csv",
+            "sensitivity": 1.0,
+            "overlap": 0.0,
+        }
+
+        # Add location filtering if provided
+        if lat is not None and lon is not None:
+            analyze_kwargs["lat"] = lat
+            analyze_kwargs["lon"] = lon
+
+        chunk_sizes = Counter(wav_path.parent for _, wav_path in extracted_files)
+        with tqdm(total=len(extracted_files), desc="Analyzing songs") as pbar:
+            for chunk_dir in sorted(chunk_sizes):
+                # Suppress verbose BirdNET output
+                with suppress_stdout():
+                    analyze(audio_input=str(chunk_dir), **analyze_kwargs)
+                pbar.update(chunk_sizes[chunk_dir])
 
         all_detections: list[SongDetection] = []
 
-        for avi_name, wav_path in tqdm(extracted_files, desc="Analyzing songs"):
-            # Build analyze kwargs for single file
-            analyze_kwargs = {
-                "audio_input": str(wav_path),
-                "output": str(results_dir),
-                "min_conf": min_confidence,
-                "threads": threads,
-                "rtype": "csv",
-                "sensitivity": 1.0,
-                "overlap": 0.0,
-            }
-
-            # Add location filtering if provided
-            if lat is not None and lon is not None:
-                analyze_kwargs["lat"] = lat
-                analyze_kwargs["lon"] = lon
-
-            # Run analysis for this file (suppress verbose BirdNET output)
-            with suppress_stdout():
-                analyze(**analyze_kwargs)
-
-            # Parse CSV result for this file
+        for avi_name, wav_path in extracted_files:
             # BirdNET creates CSV with pattern: {filename}.BirdNET.results.csv
             csv_filename = f"{wav_path.stem}.BirdNET.results.csv"
             csv_path = results_dir / csv_filename
@@ -558,6 +593,7 @@ def analyze_songs(
     config: dict[str, Any] = {
         "min_confidence": min_confidence,
         "threads": threads,
+        "batch_size": batch_size,
         "sensitivity": 1.0,
     }
     if lat is not None and lon is not None:
@@ -600,5 +636,4 @@ def save_song_detections(
 
     @author Claude Opus 4.5 Anthropic
     """
-    with open(output_path, "w") as f:
-        json.dump(results, f, indent=2)
+    write_json(output_path, results)
@@ -15,6 +15,7 @@ from typing import Any
 from tqdm import tqdm
 
 from .config import RemoteConfig, SpeciesConfig, get_species_config
+from .paths import read_json, write_json
 
 
 @dataclass
@@ -495,8 +496,7 @@ if __name__ == "__main__":
             cmd = ["scp", "-q", remote_path, str(local_path)]
             subprocess.run(cmd, check=True)
 
-            with open(local_path) as f:
-                results: dict[str, Any] = json.load(f)
+            results: dict[str, Any] = read_json(local_path)
 
             local_path.unlink()
             return results
@@ -673,5 +673,4 @@ def save_species_results(results: SpeciesResults, output_path: Path) -> None:
         ],
     }
 
-    with open(output_path, "w") as f:
-        json.dump(data, f, indent=2)
+    write_json(output_path, data)
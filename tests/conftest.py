@@ -145,23 +145,13 @@ def mock_yolo_result():
         boxes = MagicMock()
         cls_list = [d[0] for d in detections]
         conf_list = [d[1] for d in detections]
-        boxes.cls = cls_list
-        boxes.conf = conf_list
+        boxes.cls = np.array(cls_list)
+        boxes.conf = np.array(conf_list, dtype=float)
         boxes.__len__ = lambda self: len(cls_list)
+        boxes.cpu.return_value.numpy.return_value = boxes
 
-        # For frames.py: set up individual box iteration
-        mock_boxes = []
-        for i, (cls_id, conf) in enumerate(detections):
-            box = MagicMock()
-            box.cls = [cls_id]
-            box.conf = [conf]
-            # xyxy format: [x1, y1, x2, y2]
-            xyxy_tensor = MagicMock()
-            xyxy_tensor.cpu.return_value.numpy.return_value = np.array([100, 100, 300, 300])
-            box.xyxy = [xyxy_tensor]
-            mock_boxes.append(box)
-
-        boxes.__iter__ = lambda self: iter(mock_boxes)
+        # For frames.py: xyxy format [x1, y1, x2, y2] per box
+        boxes.xyxy = np.tile([100.0, 100.0, 300.0, 300.0], (len(detections), 1))
         result.boxes = boxes
         return [result]
 
@@ -203,13 +193,22 @@ def mock_video_capture():
 
         cap.get.side_effect = get_prop
 
-        if frames is not None:
-            cap.read.side_effect = frames
-        else:
+        if frames is None:
             # Default: return dummy frames then stop
             dummy_frame = np.zeros((480, 640, 3), dtype=np.uint8)
-            read_results = [(True, dummy_frame)] * frame_count + [(False, None)]
-            cap.read.side_effect = read_results
+            frames = [(True, dummy_frame)] * frame_count + [(False, None)]
+
+        # read() and grab()/retrieve() share one position in the frame list
+        remaining = iter(frames)
+        grabbed: list = [(False, None)]
+
+        def grab():
+            grabbed[0] = next(remaining)
+            return grabbed[0][0]
+
+        cap.read.side_effect = lambda: next(remaining)
+        cap.grab.side_effect = grab
+        cap.retrieve.side_effect = lambda: grabbed[0]
 
         return cap
 
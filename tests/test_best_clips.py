@@ -135,6 +135,24 @@ class TestFindBestClipForSpecies:
         # Should still find best window despite unsorted input
         assert result.detection_count >= 1
 
+    def test_unsorted_detections_picks_earliest_best_window(self):
+        """Test unsorted input yields the same window as sorted input."""
+        detections = [
+            {"timestamp_s": 40.0, "species": "Robin", "confidence": 0.5},
+            {"timestamp_s": 12.0, "species": "Robin", "confidence": 0.6},
+            {"timestamp_s": 30.0, "species": "Robin", "confidence": 0.5},
+            {"timestamp_s": 2.0, "species": "Robin", "confidence": 0.4},
+        ]
+
+        result = find_best_clip_for_species(detections, "Robin", window_duration_s=10.0)
+
+        assert result is not None
+        # Windows 2-12 and 30-40 both score 1.0; the earlier one wins
+        assert result.start_s == 2.0
+        assert result.end_s == 12.0
+        assert result.detection_count == 2
+        assert result.score == pytest.approx(1.0)
+
     def test_score_rounding(self):
         """Test that score is rounded to 3 decimal places."""
         detections = [
@@ -182,6 +200,22 @@ class TestFindAllBestClips:
         assert isinstance(result["Blue Tit"], BestClip)
         assert isinstance(result["Robin"], BestClip)
 
+    def test_find_all_interleaved_matches_per_species(self, tmp_path, sample_detections):
+        """Test grouped scan agrees with per-species scan on unsorted, interleaved input."""
+        detections = list(reversed(sample_detections))
+        species_data = {
+            "detections": detections,
+            "species_summary": {d["species"]: {} for d in detections},
+        }
+
+        species_json = tmp_path / "species.json"
+        species_json.write_text(json.dumps(species_data))
+
+        result = find_all_best_clips(species_json, window_duration_s=14.0)
+
+        for species in species_data["species_summary"]:
+            assert result[species] == find_best_clip_for_species(detections, species, 14.0)
+
     def test_find_all_with_empty_species(self, tmp_path):
         """Test with empty species data."""
         species_data = {
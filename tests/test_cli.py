@@ -0,0 +1,144 @@
+"""Tests for cli.py helpers and command input handling."""
+
+from unittest.mock import patch
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from birdbird.cli import _clear_birdbird_dir, _confirm_overwrite, app
+from birdbird.paths import BirdbirdPaths
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def no_config_location():
+    """Run commands as if ~/.birdbird/config.json had no location."""
+    with patch("birdbird.cli.get_location", return_value=(None, None)):
+        yield
+
+
+@pytest.fixture
+def processed_batch(tmp_path):
+    """Batch directory with a previous run's clips and songs.json."""
+    paths = BirdbirdPaths.from_input_dir(tmp_path)
+    paths.ensure_working_dirs()
+    paths.ensure_assets_dirs()
+    (paths.clips_dir / "1408300000.avi").write_bytes(b"fake clip")
+    paths.songs_json.write_text("{}")
+    return paths
+
+
+class TestClearBirdbirdDir:
+    """Tests for _clear_birdbird_dir()."""
+
+    def test_keeps_cache_dir(self, tmp_path):
+        """Working and asset outputs are removed; detection and duration caches survive."""
+        paths = BirdbirdPaths.from_input_dir(tmp_path)
+        paths.ensure_working_dirs()
+        paths.ensure_assets_dirs()
+        paths.detections_json.write_text("{}")
+        paths.metadata_json.write_text("{}")
+        paths.detection_cache_jsonl.write_text('["1408300000.avi:1:2:0.2:v2", null]\n')
+        paths.durations_json.write_text('{"1408300000.avi:1:2": 10.0}')
+
+        _clear_birdbird_dir(paths)
+
+        assert sorted(p.name for p in paths.birdbird_dir.iterdir() if not p.name.startswith(".")) == ["cache"]
+        assert paths.detection_cache_jsonl.read_text() == '["1408300000.avi:1:2:0.2:v2", null]\n'
+        assert paths.durations_json.read_text() == '{"1408300000.avi:1:2": 10.0}'
+
+
+@pytest.mark.usefixtures("no_config_location")
+class TestInvalidOptions:
+    """Invalid options are rejected before any previous results are removed."""
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ["--lat", "1"],
+            ["--lon", "1"],
+            ["--song-conf", "1.5"],
+            ["--song-batch-size", "0"],
+        ],
+    )
+    def test_songs_keeps_existing_results(self, processed_batch, args):
+        """songs --force exits with an error and leaves songs.json in place."""
+        result = runner.invoke(app, ["songs", str(processed_batch.input_dir), "--force", *args])
+
+        assert result.exit_code != 0
+        assert processed_batch.songs_json.read_text() == "{}"
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ["--lat", "1"],
+            ["--bird-conf", "-0.1"],
+            ["--song-conf", "2"],
+            ["--workers", "0"],
+            ["--song-batch-size", "0"],
+        ],
+    )
+    def test_process_keeps_existing_results(self, processed_batch, args):
+        """process --force exits with an error and leaves birdbird/ in place."""
+        result = runner.invoke(app, ["process", str(processed_batch.input_dir), "--force", *args])
+
+        assert result.exit_code != 0
+        assert (processed_batch.clips_dir / "1408300000.avi").exists()
+        assert processed_batch.songs_json.exists()
+
+    def test_location_error_message(self, processed_batch):
+        """A lone --lat reports that both coordinates are required."""
+        result = runner.invoke(app, ["songs", str(processed_batch.input_dir), "--lat", "1"])
+
+        assert result.exit_code == 1
+        assert "--lat and --lon must both be provided" in result.output
+
+
+class TestConfirmOverwrite:
+    """Tests for _confirm_overwrite() and the process non-TTY guard (CliRunner stdin is not a TTY)."""
+
+    def test_force_removes_file(self, tmp_path):
+        """--force removes the existing output without prompting."""
+        output = tmp_path / "songs.json"
+        output.write_text("{}")
+
+        _confirm_overwrite(output, force=True, action="re-analyze")
+
+        assert not output.exists()
+
+    def test_missing_file_is_noop(self, tmp_path):
+        """Nothing to confirm when the output does not exist yet."""
+        _confirm_overwrite(tmp_path / "songs.json", force=False, action="re-analyze")
+        _confirm_overwrite(tmp_path / "songs.json", force=True, action="re-analyze")
+
+    def test_non_tty_without_force_keeps_file(self, tmp_path):
+        """Non-interactive runs exit instead of blocking on a prompt."""
+        output = tmp_path / "songs.json"
+        output.write_text("{}")
+
+        with patch("sys.stdin.isatty", return_value=False), pytest.raises(typer.Exit) as exc_info:
+            _confirm_overwrite(output, force=False, action="re-analyze")
+
+        assert exc_info.value.exit_code == 1
+        assert output.read_text() == "{}"
+
+    @pytest.mark.usefixtures("no_config_location")
+    def test_songs_non_tty_without_force(self, processed_batch):
+        """songs exits non-zero and points at --force instead of prompting."""
+        result = runner.invoke(app, ["songs", str(processed_batch.input_dir)])
+
+        assert result.exit_code == 1
+        assert "use --force" in result.output
+        assert processed_batch.songs_json.read_text() == "{}"
+
+    @pytest.mark.usefixtures("no_config_location")
+    def test_process_non_tty_without_force(self, processed_batch):
+        """process refuses to clear an existing birdbird/ without --force."""
+        result = runner.invoke(app, ["process", str(processed_batch.input_dir), "--no-species"])
+
+        assert result.exit_code == 1
+        assert "use --force" in result.output
+        assert (processed_batch.clips_dir / "1408300000.avi").exists()
+        assert processed_batch.songs_json.exists()
@@ -4,14 +4,18 @@
 """
 
 import json
+from unittest.mock import patch
 
 from birdbird.config import (
+    DEFAULT_CALIBRATION,
     DEFAULT_LABELS_FILE,
     RemoteConfig,
     SpeciesConfig,
     get_location,
     get_species_config,
+    load_calibration,
     load_config,
+    save_calibration,
 )
 
 
@@ -59,6 +63,22 @@ class TestLoadConfig:
         result = load_config()
         assert result == {}
 
+    def test_repeat_loads_parse_once_until_file_changes(self, tmp_config_dir, monkeypatch):
+        """Unchanged config is parsed once; edits are picked up."""
+        config_path = tmp_config_dir / "config.json"
+        config_path.write_text(json.dumps({"location": {"lat": 51.5, "lon": -0.1}}))
+        monkeypatch.setattr("birdbird.config.CONFIG_PATH", config_path)
+
+        with patch("birdbird.config.json.load", wraps=json.load) as mock_load:
+            load_config()
+            get_location()
+            get_species_config()
+            assert mock_load.call_count == 1
+
+            config_path.write_text(json.dumps({"location": {"lat": 52.25, "lon": -1.5}}))
+            assert get_location() == (52.25, -1.5)
+            assert mock_load.call_count == 2
+
 
 class TestGetLocation:
     """Tests for get_location()."""
@@ -214,3 +234,34 @@ class TestSpeciesConfig:
         config = SpeciesConfig(labels_file=missing_file)
         # Should fall back to default when custom file doesn't exist
         assert config.get_labels_file() == DEFAULT_LABELS_FILE
+
+
+class TestCalibration:
+    """Tests for load_calibration() and save_calibration()."""
+
+    def test_missing_file_uses_defaults(self, tmp_config_dir, monkeypatch):
+        """No calibration file yet returns the benchmark defaults."""
+        monkeypatch.setattr("birdbird.config.CALIBRATION_PATH", tmp_config_dir / "calibration.json")
+
+        assert load_calibration() == DEFAULT_CALIBRATION
+
+    def test_save_merges_measurements(self, tmp_config_dir, monkeypatch):
+        """Saved values override defaults; unmeasured keys keep earlier values."""
+        monkeypatch.setattr("birdbird.config.CALIBRATION_PATH", tmp_config_dir / "calibration.json")
+
+        save_calibration(filter_s_per_clip=1.2345, highlights_s_per_bird_clip=4.0)
+        save_calibration(filter_s_per_clip=1.5, unknown_key=9.0)
+
+        result = load_calibration()
+        assert result["filter_s_per_clip"] == 1.5
+        assert result["highlights_s_per_bird_clip"] == 4.0
+        assert result["bird_clip_ratio"] == DEFAULT_CALIBRATION["bird_clip_ratio"]
+        assert "unknown_key" not in result
+
+    def test_invalid_values_ignored(self, tmp_config_dir, monkeypatch):
+        """Non-numeric or non-positive entries fall back to defaults."""
+        calibration_path = tmp_config_dir / "calibration.json"
+        calibration_path.write_text(json.dumps({"filter_s_per_clip": "fast", "bird_clip_ratio": 0}))
+        monkeypatch.setattr("birdbird.config.CALIBRATION_PATH", calibration_path)
+
+        assert load_calibration() == DEFAULT_CALIBRATION
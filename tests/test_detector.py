@@ -6,21 +6,36 @@
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import cv2
 import numpy as np
 import pytest
 
-from birdbird.detector import BirdDetector, Detection
+from birdbird.detector import MODEL_INPUT_SIZE, BirdDetector, Detection, _load_model, resize_for_model
 
 
 @pytest.fixture
 def detector():
     """Create BirdDetector with mocked YOLO model."""
+    _load_model.cache_clear()
     with patch("birdbird.detector.YOLO") as mock_yolo_cls:
         mock_model = MagicMock()
         mock_yolo_cls.return_value = mock_model
         det = BirdDetector(bird_confidence=0.2)
         det._mock_model = mock_model
         yield det
+    _load_model.cache_clear()
+
+
+class TestModelLoading:
+    """Tests for shared model loading."""
+
+    def test_detectors_share_loaded_model(self, detector):
+        """A second detector reuses the already-loaded weights."""
+        with patch("birdbird.detector.YOLO") as mock_yolo_cls:
+            other = BirdDetector(bird_confidence=0.5)
+
+        mock_yolo_cls.assert_not_called()
+        assert other.model is detector.model
 
 
 class TestDetectInFrameDetailed:
@@ -70,6 +85,21 @@ class TestDetectInFrameDetailed:
         assert result is not None
         assert result.confidence == 0.72
 
+    def test_first_bird_above_threshold_picked(self, detector, mock_yolo_result):
+        """A weak bird box is skipped in favour of a later confident one."""
+        detector._mock_model.return_value = mock_yolo_result([
+            (14, 0.10),  # bird below threshold
+            (0, 0.95),   # person
+            (14, 0.64),  # bird
+            (14, 0.90),  # bird
+        ])
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+        result = detector.detect_in_frame_detailed(frame)
+
+        assert result is not None
+        assert result.confidence == 0.64
+
     def test_no_detections_empty_boxes(self, detector, mock_yolo_result):
         """No detections (boxes is None) returns None."""
         detector._mock_model.return_value = mock_yolo_result(None)
@@ -98,6 +128,44 @@ class TestDetectInFrame:
         assert detector.detect_in_frame(frame) is False
 
 
+class TestResizeForModel:
+    """Tests for resize_for_model()."""
+
+    def test_large_frame_downscaled_to_model_size(self):
+        """Long side shrinks to the model input size, keeping aspect ratio."""
+        frame = np.zeros((1080, 1440, 3), dtype=np.uint8)
+
+        assert resize_for_model(frame).shape == (480, MODEL_INPUT_SIZE, 3)
+
+    def test_small_frame_unchanged(self):
+        """Frames already within the model size are passed through as-is."""
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+        assert resize_for_model(frame) is frame
+
+
+class TestHalfPrecision:
+    """Tests for FP16 selection."""
+
+    def test_cpu_inference_stays_fp32(self, detector, mock_yolo_result):
+        """Without CUDA the model is called with half=False."""
+        detector._mock_model.return_value = mock_yolo_result(None)
+        with patch("birdbird.detector._cuda_available", return_value=False):
+            cpu = BirdDetector()
+
+        cpu.detect_in_frame(np.zeros((480, 640, 3), dtype=np.uint8))
+
+        assert cpu.half is False
+        assert detector._mock_model.call_args.kwargs["half"] is False
+
+    def test_cuda_uses_fp16(self, detector, mock_yolo_result):
+        """With CUDA available, detectors request half precision."""
+        with patch("birdbird.detector._cuda_available", return_value=True):
+            other = BirdDetector()
+
+        assert other.half is True
+
+
 class TestDetectInVideoDetailed:
     """Tests for detect_in_video_detailed()."""
 
@@ -135,6 +203,58 @@ class TestDetectInVideoDetailed:
 
         assert result is None
 
+    def test_earliest_hit_in_batch_wins(self, detector, mock_yolo_result, mock_video_capture):
+        """Within a batch, the first sampled frame with a bird sets the timestamp."""
+        cap = mock_video_capture(fps=4.0, frame_count=40)
+
+        # One result per submitted frame; birds in the 2nd and 3rd samples
+        def batch_results(frames, **kwargs):
+            hits = [(0, 0.9), (14, 0.6), (14, 0.95), (0, 0.9)]
+            return [mock_yolo_result([hits[i]])[0] for i in range(len(frames))]
+
+        detector._mock_model.side_effect = batch_results
+
+        with patch("birdbird.detector.cv2") as mock_cv2:
+            mock_cv2.VideoCapture.return_value = cap
+            mock_cv2.CAP_PROP_FPS = 5
+            mock_cv2.CAP_PROP_FRAME_COUNT = 7
+
+            result = detector.detect_in_video_detailed(Path("test.avi"))
+
+        assert result == Detection(timestamp=0.25, confidence=0.6)
+        assert detector._mock_model.call_count == 1
+
+    def test_early_hit_stops_decoder(self, detector, mock_yolo_result, mock_video_capture):
+        """A hit in the first batch stops decoding well before the end and releases the video."""
+        cap = mock_video_capture(fps=30.0, frame_count=3000)
+        detector._mock_model.return_value = mock_yolo_result([(14, 0.9)])
+
+        with patch("birdbird.detector.cv2") as mock_cv2:
+            mock_cv2.VideoCapture.return_value = cap
+            mock_cv2.CAP_PROP_FPS = 5
+            mock_cv2.CAP_PROP_FRAME_COUNT = 7
+
+            result = detector.detect_in_video_detailed(Path("test.avi"))
+
+        assert result == Detection(timestamp=0.0, confidence=0.9)
+        assert cap.grab.call_count < 3000
+        cap.release.assert_called_once()
+
+    def test_decode_error_propagates(self, detector, mock_yolo_result, mock_video_capture):
+        """A decoder-thread failure is raised to the caller, not reported as no bird."""
+        cap = mock_video_capture(fps=30.0, frame_count=300)
+        cap.retrieve.side_effect = cv2.error("corrupt frame")
+        detector._mock_model.return_value = mock_yolo_result(None)
+
+        with patch("birdbird.detector.cv2") as mock_cv2:
+            mock_cv2.VideoCapture.return_value = cap
+            mock_cv2.CAP_PROP_FPS = 5
+
+            with pytest.raises(cv2.error, match="corrupt frame"):
+                detector.detect_in_video_detailed(Path("broken.avi"))
+
+        cap.release.assert_called_once()
+
     def test_video_wont_open(self, detector, mock_video_capture):
         """Video that won't open returns None."""
         cap = mock_video_capture(is_opened=False)
@@ -164,12 +284,16 @@ class TestDetectInVideoDetailed:
 
             detector.detect_in_video_detailed(Path("test.avi"))
 
-        # Model should be called for sampled frames:
-        # First second (frames 0-29): every 7 frames (30/4=7) -> frames 0,7,14,21 = 4 calls
-        # Remaining 270 frames: every 30 frames -> frames 30,60,...,270 = 9 calls
-        # Total: ~13 calls
-        call_count = detector._mock_model.call_count
-        assert 10 <= call_count <= 15
+        # Model should be given the sampled frames:
+        # First second (frames 0-29): every 7 frames (30/4=7) -> frames 0,7,14,21 = 4 samples
+        # Remaining 270 frames: every 30 frames -> frames 30,60,...,270 = 9 samples
+        # Total: ~13 samples, scored in batches of batch_size
+        sampled = sum(len(call.args[0]) for call in detector._mock_model.call_args_list)
+        assert 10 <= sampled <= 15
+        assert detector._mock_model.call_count == -(-sampled // detector.batch_size)
+        # Skipped frames are only grabbed, never converted
+        assert cap.grab.call_count == 301
+        assert cap.retrieve.call_count == sampled
 
 
 class TestDetectInVideo:
@@ -5,6 +5,7 @@
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -41,6 +42,19 @@ class TestCreateSymlinkOrCopy:
         assert not dst.is_symlink()
         assert dst.read_bytes() == b"test data"
 
+    def test_existing_destination_left_alone(self, tmp_path):
+        """An existing link is kept rather than overwritten with a copy."""
+        src = tmp_path / "source.avi"
+        src.write_bytes(b"test data")
+        dst = tmp_path / "link.avi"
+        dst.symlink_to(src)
+
+        with patch("birdbird.filter.shutil.copy2") as mock_copy:
+            create_symlink_or_copy(src, dst)
+
+        mock_copy.assert_not_called()
+        assert dst.is_symlink()
+
 
 class TestFilterClips:
     """Tests for filter_clips()."""
@@ -80,6 +94,8 @@ class TestFilterClips:
         with open(detections_path) as f:
             detections = json.load(f)
         assert len(detections) == 2
+        assert [c.name for c in stats["clips"]] == sorted(detections)
+        assert all(c.parent == stats["paths"].clips_dir for c in stats["clips"])
 
     @patch("birdbird.filter.BirdDetector")
     def test_no_clips_have_birds(self, mock_detector_cls, tmp_path):
@@ -153,3 +169,129 @@ class TestFilterClips:
         assert entry["first_bird"] == 2.5
         assert "confidence" in entry
         assert entry["confidence"] == 0.873
+
+    @patch("birdbird.filter.ProcessPoolExecutor")
+    @patch("birdbird.filter.BirdDetector")
+    def test_workers_preserve_clip_order(self, mock_detector_cls, mock_pool_cls, tmp_path):
+        """Pooled detection pairs each clip with its own result; workers are spawned, not forked."""
+        input_dir = self._make_clips_dir(tmp_path, 4)
+        # Run the pool in threads, dropping the process-only mp_context
+        mock_pool_cls.side_effect = lambda mp_context, **kwargs: ThreadPoolExecutor(**kwargs)
+
+        mock_detector = MagicMock()
+        mock_detector_cls.return_value = mock_detector
+        # Only odd-numbered clips contain birds
+        mock_detector.detect_in_video_detailed.side_effect = lambda clip: (
+            Detection(timestamp=1.0, confidence=0.9) if int(clip.stem[6:8]) % 2 else None
+        )
+
+        stats = filter_clips(input_dir, workers=2)
+
+        assert stats["with_birds"] == 2
+        with open(stats["paths"].detections_json) as f:
+            detections = json.load(f)
+        assert sorted(detections) == ["1408300100.avi", "1408300300.avi"]
+        assert mock_pool_cls.call_args.kwargs["mp_context"].get_start_method() == "spawn"
+
+    @patch("birdbird.filter.BirdDetector")
+    def test_rerun_uses_detection_cache(self, mock_detector_cls, tmp_path):
+        """Unchanged clips are not re-scanned on a second run at the same threshold."""
+        input_dir = self._make_clips_dir(tmp_path, 2)
+
+        mock_detector = MagicMock()
+        mock_detector_cls.return_value = mock_detector
+        mock_detector.detect_in_video_detailed.side_effect = [
+            Detection(timestamp=1.5, confidence=0.85),
+            None,
+        ]
+
+        first = filter_clips(input_dir, bird_confidence=0.2)
+        second = filter_clips(input_dir, bird_confidence=0.2)
+
+        assert mock_detector.detect_in_video_detailed.call_count == 2
+        assert (first["scanned"], second["scanned"]) == (2, 0)
+        assert second["with_birds"] == first["with_birds"] == 1
+        with open(second["paths"].detections_json) as f:
+            assert json.load(f) == {"1408300000.avi": {"first_bird": 1.5, "confidence": 0.85}}
+
+    @patch("birdbird.filter.BirdDetector")
+    def test_detection_cache_keyed_by_threshold_and_content(self, mock_detector_cls, tmp_path):
+        """A new threshold or a modified clip misses the cache."""
+        input_dir = self._make_clips_dir(tmp_path, 2)
+
+        mock_detector = MagicMock()
+        mock_detector_cls.return_value = mock_detector
+        mock_detector.detect_in_video_detailed.return_value = None
+
+        filter_clips(input_dir, bird_confidence=0.2)
+        filter_clips(input_dir, bird_confidence=0.5)
+        assert mock_detector.detect_in_video_detailed.call_count == 4
+
+        (input_dir / "1408300100.avi").write_bytes(b"new footage")
+        filter_clips(input_dir, bird_confidence=0.5)
+        assert mock_detector.detect_in_video_detailed.call_count == 5
+        assert mock_detector.detect_in_video_detailed.call_args.args[0].name == "1408300100.avi"
+
+    @patch("birdbird.filter.BirdDetector")
+    def test_detector_version_bump_misses_cache(self, mock_detector_cls, tmp_path):
+        """Results cached by an older detector version are re-scanned."""
+        input_dir = self._make_clips_dir(tmp_path, 2)
+
+        mock_detector = MagicMock()
+        mock_detector_cls.return_value = mock_detector
+        mock_detector.detect_in_video_detailed.return_value = None
+
+        filter_clips(input_dir, bird_confidence=0.2)
+        with patch("birdbird.filter.DETECTION_VERSION", 99):
+            result = filter_clips(input_dir, bird_confidence=0.2)
+
+        assert result["scanned"] == 2
+        assert mock_detector.detect_in_video_detailed.call_count == 4
+
+    @patch("birdbird.filter.BirdDetector")
+    def test_cache_compacted_after_pass(self, mock_detector_cls, tmp_path):
+        """Entries for deleted or modified clips are dropped; other thresholds kept."""
+        input_dir = self._make_clips_dir(tmp_path, 3)
+
+        mock_detector = MagicMock()
+        mock_detector_cls.return_value = mock_detector
+        mock_detector.detect_in_video_detailed.return_value = None
+
+        filter_clips(input_dir, bird_confidence=0.2)
+        filter_clips(input_dir, bird_confidence=0.5)
+        (input_dir / "1408300000.avi").unlink()
+        (input_dir / "1408300100.avi").write_bytes(b"new footage")
+        filter_clips(input_dir, bird_confidence=0.5)
+
+        cache_path = input_dir / "birdbird" / "cache" / "detection_cache.jsonl"
+        keys = [json.loads(line)[0] for line in cache_path.read_text().splitlines()]
+        # 1408300100 keeps only its fresh 0.5 entry; 1408300200 keeps both thresholds
+        assert len(keys) == 3
+        assert not any(key.startswith("1408300000.avi") for key in keys)
+        assert sum(key.startswith("1408300100.avi") for key in keys) == 1
+        assert sum(key.startswith("1408300200.avi") for key in keys) == 2
+
+    @patch("birdbird.filter.BirdDetector")
+    def test_interrupted_run_keeps_scanned_clips(self, mock_detector_cls, tmp_path):
+        """Clips scanned before a crash are not re-scanned; a torn cache line is skipped."""
+        input_dir = self._make_clips_dir(tmp_path, 3)
+
+        mock_detector = MagicMock()
+        mock_detector_cls.return_value = mock_detector
+        mock_detector.detect_in_video_detailed.side_effect = [
+            Detection(timestamp=1.5, confidence=0.85),
+            RuntimeError("decoder crashed"),
+        ]
+
+        with pytest.raises(RuntimeError):
+            filter_clips(input_dir, bird_confidence=0.2)
+
+        cache_path = input_dir / "birdbird" / "cache" / "detection_cache.jsonl"
+        with open(cache_path, "a") as f:
+            f.write('["1408300100.avi:')
+
+        mock_detector.detect_in_video_detailed.side_effect = [None, None]
+        result = filter_clips(input_dir, bird_confidence=0.2)
+
+        assert result["scanned"] == 2
+        assert result["with_birds"] == 1
@@ -20,6 +20,17 @@ from birdbird.frames import (
 )
 
 
+def _bird_boxes(xyxy):
+    """Mock YOLO Boxes holding one bird (conf 0.85) at the given xyxy bbox."""
+    boxes = MagicMock()
+    boxes.__len__ = lambda self: 1
+    boxes.cls = np.array([14.0])
+    boxes.conf = np.array([0.85])
+    boxes.xyxy = np.array([xyxy], dtype=float)
+    boxes.cpu.return_value.numpy.return_value = boxes
+    return boxes
+
+
 class TestCalculateSharpness:
     """Tests for calculate_sharpness()."""
 
@@ -61,17 +72,8 @@ class TestCalculateBirdSize:
 
         # Create mock result with bird bbox
         result_mock = MagicMock()
-        box = MagicMock()
-        box.cls = [14]
-        box.conf = [0.85]
         # bbox 200x200 = 40000 pixels
-        xyxy_tensor = MagicMock()
-        xyxy_tensor.cpu.return_value.numpy.return_value = np.array([100, 100, 300, 300])
-        box.xyxy = [xyxy_tensor]
-
-        boxes = MagicMock()
-        boxes.__len__ = lambda self: 1
-        boxes.__iter__ = lambda self: iter([box])
+        boxes = _bird_boxes([100, 100, 300, 300])
         result_mock.boxes = boxes
 
         detector.model.return_value = [result_mock]
@@ -109,17 +111,8 @@ class TestCalculatePosition:
         frame = np.zeros((480, 640, 3), dtype=np.uint8)
 
         result_mock = MagicMock()
-        box = MagicMock()
-        box.cls = [14]
-        box.conf = [0.85]
         # bbox well inside frame
-        xyxy_tensor = MagicMock()
-        xyxy_tensor.cpu.return_value.numpy.return_value = np.array([100, 100, 300, 300])
-        box.xyxy = [xyxy_tensor]
-
-        boxes = MagicMock()
-        boxes.__len__ = lambda self: 1
-        boxes.__iter__ = lambda self: iter([box])
+        boxes = _bird_boxes([100, 100, 300, 300])
         result_mock.boxes = boxes
         detector.model.return_value = [result_mock]
 
@@ -136,17 +129,8 @@ class TestCalculatePosition:
         frame = np.zeros((480, 640, 3), dtype=np.uint8)
 
         result_mock = MagicMock()
-        box = MagicMock()
-        box.cls = [14]
-        box.conf = [0.85]
         # bbox touching left edge (x1=5 < threshold=10)
-        xyxy_tensor = MagicMock()
-        xyxy_tensor.cpu.return_value.numpy.return_value = np.array([5, 100, 200, 300])
-        box.xyxy = [xyxy_tensor]
-
-        boxes = MagicMock()
-        boxes.__len__ = lambda self: 1
-        boxes.__iter__ = lambda self: iter([box])
+        boxes = _bird_boxes([5, 100, 200, 300])
         result_mock.boxes = boxes
         detector.model.return_value = [result_mock]
 
@@ -232,15 +216,7 @@ class TestExtractAndScoreFrames:
 
         # Mock YOLO results for bird_size and position
         result_mock = MagicMock()
-        box = MagicMock()
-        box.cls = [14]
-        box.conf = [0.85]
-        xyxy_tensor = MagicMock()
-        xyxy_tensor.cpu.return_value.numpy.return_value = np.array([100, 100, 300, 300])
-        box.xyxy = [xyxy_tensor]
-        boxes = MagicMock()
-        boxes.__len__ = lambda self: 1
-        boxes.__iter__ = lambda self: iter([box])
+        boxes = _bird_boxes([100, 100, 300, 300])
         result_mock.boxes = boxes
         detector.model.return_value = [result_mock]
 
@@ -17,6 +17,8 @@ from birdbird.highlights import (
     extract_segment,
     find_bird_segments,
     get_video_duration,
+    total_video_duration,
+    video_durations,
     _binary_search_entry,
     _binary_search_exit,
 )
@@ -90,6 +92,67 @@ class TestGetVideoDuration:
         assert duration == 0.0
 
 
+class TestTotalVideoDuration:
+    """Tests for total_video_duration()."""
+
+    def test_sums_all_clips(self):
+        """Sums per-clip durations."""
+        clips = [Path("a.avi"), Path("b.avi"), Path("c.avi")]
+        durations = {"a.avi": 10.0, "b.avi": 2.5, "c.avi": 0.0}
+
+        with patch("birdbird.highlights.get_video_duration", side_effect=lambda c: durations[c.name]):
+            total = total_video_duration(clips)
+
+        assert total == pytest.approx(12.5)
+
+    def test_no_clips(self):
+        """Returns 0.0 for an empty list."""
+        assert total_video_duration([]) == 0.0
+
+
+class TestVideoDurations:
+    """Tests for video_durations() disk cache."""
+
+    def test_cache_hit_skips_probe(self, tmp_path):
+        """Second call reads durations from the cache file."""
+        clip = tmp_path / "a.avi"
+        clip.write_bytes(b"x")
+        cache_path = tmp_path / "durations.json"
+
+        with patch("birdbird.highlights.get_video_duration", return_value=10.0) as probe:
+            first = video_durations([clip], cache_path)
+            second = video_durations([clip], cache_path)
+
+        assert first == second == {clip: 10.0}
+        probe.assert_called_once_with(clip)
+
+    def test_changed_clip_is_reprobed(self, tmp_path):
+        """A clip whose size changed misses the cache."""
+        clip = tmp_path / "a.avi"
+        clip.write_bytes(b"x")
+        cache_path = tmp_path / "durations.json"
+
+        with patch("birdbird.highlights.get_video_duration", side_effect=[10.0, 20.0]) as probe:
+            video_durations([clip], cache_path)
+            clip.write_bytes(b"xx")
+            durations = video_durations([clip], cache_path)
+
+        assert durations == {clip: 20.0}
+        assert probe.call_count == 2
+
+    def test_corrupt_cache_ignored(self, tmp_path):
+        """An unreadable cache file is treated as empty."""
+        clip = tmp_path / "a.avi"
+        clip.write_bytes(b"x")
+        cache_path = tmp_path / "durations.json"
+        cache_path.write_text("{not json")
+
+        with patch("birdbird.highlights.get_video_duration", return_value=5.0):
+            durations = video_durations([clip], cache_path)
+
+        assert durations == {clip: 5.0}
+
+
 class TestBinarySearchEntry:
     """Tests for _binary_search_entry()."""
 
@@ -5,13 +5,17 @@
 
 import json
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from birdbird.paths import (
     BirdbirdPaths,
     get_asset_frame_paths,
+    list_clips,
     load_detections,
+    read_json,
+    write_json,
 )
 
 
@@ -35,6 +39,14 @@ class TestBirdbirdPaths:
         assert paths.clips_dir == tmp_input_dir / "birdbird" / "working" / "filter" / "clips"
         assert paths.detections_json == tmp_input_dir / "birdbird" / "working" / "filter" / "detections.json"
 
+    def test_from_input_dir_cache_paths(self, tmp_input_dir):
+        """Test cache paths sit outside working/ and assets/."""
+        paths = BirdbirdPaths.from_input_dir(tmp_input_dir)
+
+        assert paths.cache_dir == tmp_input_dir / "birdbird" / "cache"
+        assert paths.detection_cache_jsonl == tmp_input_dir / "birdbird" / "cache" / "detection_cache.jsonl"
+        assert paths.durations_json == tmp_input_dir / "birdbird" / "cache" / "durations.json"
+
     def test_from_input_dir_frames_paths(self, tmp_input_dir):
         """Test frames-related paths."""
         paths = BirdbirdPaths.from_input_dir(tmp_input_dir)
@@ -77,6 +89,7 @@ class TestBirdbirdPaths:
         assert paths.clips_dir.is_dir()
         assert paths.frames_candidates_dir.exists()
         assert paths.frames_candidates_dir.is_dir()
+        assert paths.cache_dir.is_dir()
 
         # Should be idempotent (no error on second call)
         paths.ensure_working_dirs()
@@ -139,6 +152,78 @@ class TestGetAssetFramePaths:
         assert paths[9].name == "frame_10.jpg"
 
 
+class TestListClips:
+    """Tests for list_clips()."""
+
+    def test_lists_sorted_avi_files(self, tmp_input_dir):
+        """Test only .avi files are returned, sorted by name."""
+        (tmp_input_dir / "notes.txt").touch()
+        (tmp_input_dir / "birdbird").mkdir()
+
+        result = list_clips(tmp_input_dir)
+
+        assert result == [
+            tmp_input_dir / "1408301500.avi",
+            tmp_input_dir / "1408301600.avi",
+            tmp_input_dir / "1508301700.avi",
+        ]
+
+    def test_limit(self, tmp_input_dir):
+        """Test limit keeps the first N clips by name."""
+        result = list_clips(tmp_input_dir, limit=2)
+
+        assert [p.name for p in result] == ["1408301500.avi", "1408301600.avi"]
+
+    def test_empty_directory(self, tmp_path):
+        """Test empty directory returns empty list."""
+        assert list_clips(tmp_path) == []
+
+
+class TestReadJson:
+    """Tests for read_json()."""
+
+    def test_reads_document(self, tmp_path):
+        """Test parsing a JSON file with whichever backend is installed."""
+        json_path = tmp_path / "species.json"
+        test_data = {"detections": [{"species": "Robin", "confidence": 0.9}], "total_frames": 3}
+        json_path.write_text(json.dumps(test_data))
+
+        assert read_json(json_path) == test_data
+
+    def test_falls_back_to_stdlib_json(self, tmp_path):
+        """Test stdlib json is used when orjson is not installed."""
+        json_path = tmp_path / "songs.json"
+        test_data = {"summary": {"species_list": ["Parus major"]}}
+        json_path.write_text(json.dumps(test_data))
+
+        with patch("birdbird.paths.orjson", None):
+            assert read_json(json_path) == test_data
+
+
+class TestWriteJson:
+    """Tests for write_json()."""
+
+    def test_round_trip(self, tmp_path):
+        """Test written JSON is indented and parses back to the same data."""
+        json_path = tmp_path / "metadata.json"
+        test_data = {"batch_id": "20260114", "clips": 42, "songs": {"species_list": ["Robin"]}}
+
+        write_json(json_path, test_data)
+
+        assert json.loads(json_path.read_text()) == test_data
+        assert "\n  " in json_path.read_text()
+
+    def test_falls_back_to_stdlib_json(self, tmp_path):
+        """Test stdlib json is used when orjson is not installed."""
+        json_path = tmp_path / "detections.json"
+        test_data = {"clip.avi": {"first_bird": 1.5, "confidence": 0.8}}
+
+        with patch("birdbird.paths.orjson", None):
+            write_json(json_path, test_data)
+
+        assert json.loads(json_path.read_text()) == test_data
+
+
 class TestLoadDetections:
     """Tests for load_detections()."""
 
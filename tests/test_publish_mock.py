@@ -10,6 +10,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 from botocore.exceptions import ClientError
 
+from birdbird.paths import BirdbirdPaths
 from birdbird.publish import (
     calculate_md5,
     cleanup_old_batches,
@@ -17,6 +18,7 @@ from birdbird.publish import (
     get_highlights_duration,
     list_batches,
     should_upload_file,
+    upload_batch,
 )
 
 
@@ -252,3 +254,41 @@ class TestCleanupOldBatches:
 
         assert result == []
         mock_s3_client.delete_object.assert_not_called()
+
+
+class TestUploadBatch:
+    """Tests for upload_batch()."""
+
+    @patch("birdbird.publish.get_highlights_duration", return_value=60.0)
+    @patch("birdbird.publish.extract_date_range", return_value=("2026-01-14", "2026-01-14"))
+    def test_song_clips_uploaded_concurrently_in_order(self, _dates, _duration, mock_s3_client, tmp_path):
+        """Song clips upload through the pool; unchanged ones are skipped in clip order."""
+        paths = BirdbirdPaths.from_input_dir(tmp_path / "20260114")
+        paths.ensure_assets_dirs()
+        paths.highlights_mp4.write_bytes(b"mp4")
+        paths.song_clips_dir.mkdir(exist_ok=True)
+        for name in ("a.wav", "b.wav", "c.wav"):
+            (paths.song_clips_dir / name).write_bytes(name.encode())
+
+        # b.wav is already in the bucket unchanged
+        def changed(s3_client, bucket, key, local_path):
+            return local_path.name != "b.wav"
+
+        with patch("birdbird.publish.should_upload_file", side_effect=changed):
+            with patch("birdbird.publish.typer.echo"):
+                metadata = upload_batch(
+                    mock_s3_client,
+                    "bucket",
+                    "20260114_01",
+                    paths,
+                    clip_count=3,
+                    original_date="20260114",
+                    song_clips_dir=paths.song_clips_dir,
+                    batch_exists=True,
+                    upload_workers=3,
+                )
+
+        stats = metadata["_upload_stats"]
+        assert stats["uploaded"] == ["highlights.mp4", "song_clips/a.wav", "song_clips/c.wav", "metadata.json"]
+        assert stats["skipped"] == ["song_clips/b.wav"]
+        assert [c["filename"] for c in metadata["song_clips"]] == ["a.wav", "b.wav", "c.wav"]
@@ -0,0 +1,72 @@
+"""Smoke tests for review_person_detections.py (mocked YOLO and frame reads)."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+import review_person_detections as review
+
+
+def _make_batch(tmp_path, clip_names):
+    """Create a batch dir with clips and the detections.json filter would write."""
+    input_dir = tmp_path / "batch"
+    filter_dir = input_dir / "birdbird" / "working" / "filter"
+    filter_dir.mkdir(parents=True)
+    for name in clip_names:
+        (input_dir / name).write_bytes(b"fake video")
+    detections = {name: {"first_bird": 1.5, "confidence": 0.8} for name in clip_names}
+    (filter_dir / "detections.json").write_text(json.dumps(detections))
+    return input_dir
+
+
+def _mock_detector():
+    """Detector whose model sees a bird (0.5) and a person (0.367) in every frame."""
+    detector = MagicMock()
+    detector.BIRD_CLASS_ID = 14
+    detector.model.ckpt_path = "yolov8n.pt"
+    boxes = [SimpleNamespace(cls=[14], conf=[0.5]), SimpleNamespace(cls=[0], conf=[0.367])]
+    detector.model.side_effect = lambda frames, **kwargs: [SimpleNamespace(boxes=boxes) for _ in frames]
+    return detector
+
+
+class TestMain:
+    """End-to-end runs of main()."""
+
+    def _run(self, input_dir, detector):
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        with (
+            patch.object(review, "BirdDetector", return_value=detector),
+            patch.object(review, "read_frame_cv2", return_value=(45, frame)),
+            patch("sys.argv", ["review_person_detections.py", str(input_dir), "--batch-size", "2"]),
+        ):
+            review.main()
+
+    def test_saves_frames_with_confidences(self, tmp_path):
+        """Every detected clip gets a frame named with its bird and person confidences."""
+        input_dir = _make_batch(tmp_path, ["1408300000.avi", "1408300100.avi", "1408300200.avi"])
+        detector = _mock_detector()
+
+        self._run(input_dir, detector)
+
+        output_dir = input_dir / "birdbird" / "working" / "person_review"
+        saved = sorted(p.name for p in output_dir.glob("*.jpg"))
+        assert saved == [
+            "1408300000_bird500_person367.jpg",
+            "1408300100_bird500_person367.jpg",
+            "1408300200_bird500_person367.jpg",
+        ]
+        # Two batches of --batch-size 2, restricted to bird and person classes
+        assert detector.model.call_count == 2
+        assert detector.model.call_args.kwargs["classes"] == [14, review.PERSON_CLASS_ID]
+
+    def test_rerun_uses_confidence_cache(self, tmp_path):
+        """A second run answers every frame from the SQLite cache."""
+        input_dir = _make_batch(tmp_path, ["1408300000.avi", "1408300100.avi"])
+        detector = _mock_detector()
+
+        self._run(input_dir, detector)
+        self._run(input_dir, detector)
+
+        assert detector.model.call_count == 1
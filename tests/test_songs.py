@@ -218,6 +218,19 @@ class TestValidateTimestamps:
 
         assert result is False
 
+    def test_prebuilt_clip_list(self, tmp_path):
+        """Test with a pre-enumerated clip list instead of scanning input_dir."""
+        input_dir = tmp_path / "20260114"
+        input_dir.mkdir()
+
+        clips = [input_dir / "1408301500.avi", input_dir / "1508301600.avi"]
+        dir_date = datetime(2026, 1, 14)
+
+        result = validate_timestamps(input_dir, dir_date, clips)
+
+        # Files don't exist on disk; only the given names are used
+        assert result is True
+
     def test_malformed_filenames(self, tmp_path):
         """Test with malformed filenames."""
         input_dir = tmp_path / "20260114"
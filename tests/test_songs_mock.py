@@ -130,10 +130,9 @@ class TestAnalyzeSongs:
 
         # Mock the BirdNET analyze function and CSV output
         def fake_analyze(**kwargs):
-            # Create a CSV result file
-            audio_input = Path(kwargs["audio_input"])
+            # Create a CSV result file for the clip in the audio directory
             output_dir = Path(kwargs["output"])
-            csv_path = output_dir / f"{audio_input.stem}.BirdNET.results.csv"
+            csv_path = output_dir / "1408301500.BirdNET.results.csv"
             csv_path.write_text(
                 "Start (s),End (s),Scientific name,Common name,Confidence,File\n"
                 "0.0,3.0,Cyanistes caeruleus,Eurasian Blue Tit,0.91,test.wav\n"
@@ -161,6 +160,55 @@ class TestAnalyzeSongs:
         with pytest.raises(ValueError, match="Failed to extract audio"):
             analyze_songs(input_dir)
 
+    @patch("birdbird.songs.suppress_stdout")
+    @patch("birdbird.songs.extract_audio")
+    def test_failed_extractions_skipped(self, mock_extract, mock_suppress, tmp_path):
+        """Clips whose audio extraction fails are not analyzed; others keep clip order."""
+        input_dir = tmp_path / "20260114"
+        input_dir.mkdir()
+        for name in ("1408301500.avi", "1408301600.avi", "1408301700.avi"):
+            (input_dir / name).touch()
+
+        def fake_extract(avi_path, wav_path):
+            # Failed extraction still leaves partial output behind
+            wav_path.touch()
+            return avi_path.name != "1408301600.avi"
+
+        mock_extract.side_effect = fake_extract
+        calls = []
+
+        def fake_analyze(**kwargs):
+            audio_dir = Path(kwargs["audio_input"])
+            calls.append((sorted(p.stem for p in audio_dir.iterdir()), kwargs["batch_size"]))
+
+        with patch("birdnet_analyzer.analyze", fake_analyze):
+            result = analyze_songs(input_dir, extract_clips=False, threads=3, batch_size=4)
+
+        # One BirdNET run over the chunk directory, without the failed clip
+        assert calls == [(["1408301500", "1408301700"], 4)]
+        assert result["summary"]["files_processed"] == 3
+
+    @patch("birdbird.songs.ANALYZE_CHUNK_FILES", 2)
+    @patch("birdbird.songs.suppress_stdout")
+    @patch("birdbird.songs.extract_audio")
+    def test_analyzes_in_chunks(self, mock_extract, mock_suppress, tmp_path):
+        """Clips are analyzed in ANALYZE_CHUNK_FILES-sized BirdNET runs, in clip order."""
+        input_dir = tmp_path / "20260114"
+        input_dir.mkdir()
+        for name in ("1408301500.avi", "1408301600.avi", "1408301700.avi"):
+            (input_dir / name).touch()
+
+        mock_extract.side_effect = lambda avi_path, wav_path: wav_path.touch() or True
+        calls = []
+
+        def fake_analyze(**kwargs):
+            calls.append(sorted(p.stem for p in Path(kwargs["audio_input"]).iterdir()))
+
+        with patch("birdnet_analyzer.analyze", fake_analyze):
+            analyze_songs(input_dir, extract_clips=False)
+
+        assert calls == [["1408301500", "1408301600"], ["1408301700"]]
+
 
 class TestSaveSongDetections:
     """Tests for save_song_detections()."""